@@ -0,0 +1,16 @@
+from evalresults.catalog import Catalog
+from evalresults.parsers import Clauses, SignMatrix, read_dimacs, read_group, read_properties, read_sample
+from evalresults.run import Run, SystemData, resolve_run_dir
+
+__all__ = [
+    'Catalog',
+    'Clauses',
+    'SignMatrix',
+    'read_dimacs',
+    'read_group',
+    'read_properties',
+    'read_sample',
+    'Run',
+    'SystemData',
+    'resolve_run_dir',
+]
@@ -0,0 +1,93 @@
+import os
+import re
+from functools import cached_property
+
+import pandas as pd
+
+from evalresults.run import Run
+
+_RUN_DIR = re.compile(r'\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2}')
+
+
+class Catalog:
+    """Index of all results/<timestamp> runs.
+
+    Runs are opened lazily and the data/ tree of each run is walked at most once. Tables are read from the pickles
+    that plot.py wrote, so several runs can be compared without re-joining any of them.
+    """
+
+    def __init__(self, results_dir_name='results'):
+        self.results_dir_name = results_dir_name
+        self._runs = {}
+
+    @cached_property
+    def run_names(self):
+        if not os.path.isdir(self.results_dir_name):
+            return []
+        return sorted(name for name in os.listdir(self.results_dir_name)
+                      if _RUN_DIR.fullmatch(name) and os.path.isdir(os.path.join(self.results_dir_name, name)))
+
+    def current_name(self):
+        current = os.path.join(self.results_dir_name, '.current')
+        if os.path.exists(current):
+            with open(current) as f:
+                return f.readline().strip()
+        return self.run_names[-1] if self.run_names else None
+
+    def run(self, name):
+        if name not in self.run_names:
+            raise KeyError('No run %s in %s' % (name, self.results_dir_name))
+        if name not in self._runs:
+            self._runs[name] = Run(os.path.join(self.results_dir_name, name))
+        return self._runs[name]
+
+    def configs(self):
+        """Returns one row per run, data directory, and property of its config.properties."""
+        rows = [(run_name, data_dir, key, value)
+                for run_name in self.run_names
+                for data_dir, properties in self.run(run_name).data_dirs.items()
+                for key, value in properties.items()]
+        return pd.DataFrame(rows, columns=['Run', 'DataDir', 'Property', 'Value'])
+
+    def table(self, name, runs=None, columns=None, where=None):
+        """Stacks a pickled table of several runs, adding a Run column.
+
+        where is an optional function that receives the table of one run and returns a boolean row mask. where and
+        columns are applied right after a run's table is read, so only one whole table is held in memory at a time and
+        only the requested slice of each run is kept.
+
+        Without runs, all runs that have the pickled table are stacked and the others are skipped and named. Given
+        runs must all have the table, otherwise a FileNotFoundError names the runs that plot.py has not prepared yet.
+        """
+        run_names = self.run_names if runs is None else list(runs)
+        missing = [run_name for run_name in run_names if not self.run(run_name).has_table(name)]
+        if missing and runs is not None:
+            raise FileNotFoundError('No %s.pkl in run(s) %s, run "python3 plot.py --prepare-only <run directory>" first'
+                                    % (name, ', '.join(missing)))
+        if missing:
+            print('Skipping run(s) without %s.pkl: %s' % (name, ', '.join(missing)))
+            run_names = [run_name for run_name in run_names if run_name not in missing]
+        if not run_names:
+            raise FileNotFoundError('No run in %s has %s.pkl, run "python3 plot.py --prepare-only <run directory>" '
+                                    'first' % (self.results_dir_name, name))
+
+        frames = []
+        for run_name in run_names:
+            df = self.run(run_name).load_table(name)
+            if where is not None:
+                df = df[where(df)]
+            if columns is not None:
+                df = df[columns]
+            frames.append(df.assign(Run=run_name))
+        return pd.concat(frames, ignore_index=True)
+
+    def compare(self, value, key, runs, name='complete', where=None, aggregate='median'):
+        """Aligns a column of several runs on the given key columns.
+
+        Returns one row per key that is present in all runs and one column per run, holding the aggregated value.
+        """
+        columns = list(key) + [value]
+        df = self.table(name, runs, columns, where)
+        df = df.groupby(list(key) + ['Run'], observed=True)[value].agg(aggregate).reset_index()
+        df = df.pivot(index=list(key), columns='Run', values=value)
+        return df[list(runs)].dropna()
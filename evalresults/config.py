@@ -0,0 +1,62 @@
+import os
+import sys
+from dataclasses import dataclass
+
+from evalresults.run import Run, resolve_run_dir
+
+
+@dataclass
+class Config:
+    root_dir_name: str
+    run: Run
+    out_dir_name: str
+    save_results: bool
+    show_results: bool
+    colors: list
+    pdf_width: int
+    pdf_height: int
+    color_t1: str
+    color_t2: str
+    color_t3: str
+    axis_title_x: int
+    axis_title_y: int
+    strip_text_x: int
+    text: int
+    size_x: int
+    size_y: int
+    rasterize: bool
+    points_per_facet: int
+    database: object
+
+    def __init__(self, argv):
+        self.root_dir_name = resolve_run_dir(argv)
+        self.run = Run(self.root_dir_name)
+
+        self.out_dir_name = self.root_dir_name + '/plot/'
+
+        self.show_results = False
+        self.save_results = True
+        self.pdf_width = 400
+        self.pdf_height = 200
+        self.color_t1 = '#D95F02'
+        self.color_t2 = '#0072B2'
+        self.color_t3 = '#009E73'
+        self.axis_title_x = 12
+        self.axis_title_y = 12
+        self.strip_text_x = 10
+        self.text = 10
+        self.size_x = 150
+        self.size_y = 150
+        self.rasterize = False
+        self.points_per_facet = None
+        self.database = None
+
+
+def create_out_dir(config, name=''):
+    out_dir_name = os.path.dirname(config.out_dir_name + name)
+    if not os.path.exists(out_dir_name):
+        try:
+            os.makedirs(out_dir_name)
+        except OSError:
+            print("Failed to create output directory %s" % out_dir_name)
+            sys.exit(-1)
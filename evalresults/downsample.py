@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+
+
+def lttb(x, y, budget):
+    """Returns the indices of at most budget points that preserve the shape of the line (x, y).
+
+    Implements Largest-Triangle-Three-Buckets: the first and last point are kept, the remaining points are split into
+    budget - 2 buckets, and from each bucket the point spanning the largest triangle with the previously selected
+    point and the mean of the next bucket is selected. x must be sorted.
+    """
+    n = len(x)
+    if budget >= n or budget < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    edges = np.linspace(1, n - 1, budget - 1).astype(np.int64)
+
+    selected = np.empty(budget, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    a = 0
+    for i in range(budget - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start, next_end = end, (edges[i + 2] if i + 2 < len(edges) else n)
+        mean_x = x[next_start:next_end].mean()
+        mean_y = y[next_start:next_end].mean()
+        areas = np.abs((x[a] - mean_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (mean_y - y[a]))
+        a = start + int(np.argmax(areas))
+        selected[i + 1] = a
+    return selected
+
+
+def downsample_lines(df, x, y, facet, series, budget):
+    """Reduces every facet of a line plot to about budget points, split evenly between the lines of the facet.
+
+    Each line keeps at least 3 points, so a facet with more than budget / 3 lines exceeds the budget. Such facets are
+    named in a warning.
+    """
+    if budget is None:
+        return df
+    if budget < 3:
+        raise ValueError('budget must be at least 3, but was %d' % budget)
+
+    frames = []
+    over_budget = []
+    for facet_name, facet_df in df.groupby(facet, observed=True, sort=False):
+        lines = facet_df.groupby(series, observed=True, sort=False)
+        if lines.ngroups * 3 > budget:
+            over_budget.append('%s (%d lines)' % (facet_name, lines.ngroups))
+        line_budget = max(3, budget // lines.ngroups)
+        for _, line_df in lines:
+            line_df = line_df.sort_values(x)
+            frames.append(line_df.iloc[lttb(line_df[x].to_numpy(), line_df[y].to_numpy(), line_budget)])
+    if over_budget:
+        print('Warning: keeping 3 points per line exceeds the budget of %d points in facet(s) %s'
+              % (budget, ', '.join(str(name) for name in over_budget)))
+    return pd.concat(frames) if frames else df
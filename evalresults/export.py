@@ -0,0 +1,38 @@
+from evalresults.config import create_out_dir
+
+
+def create_csv(config, df, name):
+    create_out_dir(config, name)
+
+    if config.show_results:
+        print(df)
+
+    if config.save_results:
+        df.to_csv(config.out_dir_name + name + '.csv', index=False, sep=';')
+
+
+def create_table(config, df, name):
+    create_out_dir(config, name)
+
+    table = df.style.format(decimal='.', thousands=',', precision=2, escape="latex").to_latex(multicol_align='c')
+
+    if config.show_results:
+        print(table)
+
+    if config.save_results:
+        with open(config.out_dir_name + name + '.tex', 'w') as f:
+            print(table, file=f)
+
+
+def export_tables(config, data, systems, metrics):
+    create_csv(config, systems.reset_index(), 'systems')
+    create_csv(config, metrics.reset_index(), 'metrics')
+
+    df = data[data['Size'] == data['PartialSampleSize']]
+    df = df.groupby(['T', 'Incremental', 'Metric'], observed=True).agg({
+        'FilteredVariableCount': 'median',
+        'InteractionReduction': 'median',
+        'CoverageTime': 'median',
+        'MetricTime': 'median'}).reset_index()
+    create_csv(config, df, 'metric_summary')
+    create_table(config, df, 'metric_summary')
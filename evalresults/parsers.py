@@ -0,0 +1,161 @@
+import os
+import re
+from dataclasses import dataclass
+
+import numpy as np
+
+# Maps the cell characters written by BooleanAssignmentGroupsCSVFormat to literal signs
+_SIGNS = np.zeros(256, dtype=np.int8)
+_SIGNS[ord('+')] = 1
+_SIGNS[ord('-')] = -1
+
+# Splits a java properties line at the first unescaped separator
+_PROPERTY = re.compile(r'((?:\\.|[^=:\s\\])*)\s*[=:]?\s*(.*)')
+
+# Escapes that Properties.store writes, the others just stand for the escaped character
+_ESCAPE = re.compile(r'\\(u[0-9a-fA-F]{4}|.)')
+_ESCAPED_CHARACTERS = {'t': '\t', 'n': '\n', 'r': '\r', 'f': '\f'}
+
+
+@dataclass
+class Clauses:
+    """CNF in compressed sparse row layout.
+
+    The literals of clause i are indices[indptr[i]:indptr[i + 1]].
+    """
+    variable_names: list
+    indptr: np.ndarray
+    indices: np.ndarray
+
+    @property
+    def variable_count(self):
+        return len(self.variable_names)
+
+    @property
+    def clause_count(self):
+        return len(self.indptr) - 1
+
+    def clause(self, i):
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def clause_sizes(self):
+        return np.diff(self.indptr)
+
+
+@dataclass
+class SignMatrix:
+    """Rows of a group or sample csv file.
+
+    values holds one int8 per row and variable (1 = '+', -1 = '-', 0 = '0').
+    """
+    variable_names: list
+    ids: np.ndarray
+    groups: np.ndarray
+    values: np.ndarray
+
+    def __len__(self):
+        return self.values.shape[0]
+
+    @property
+    def variable_count(self):
+        return len(self.variable_names)
+
+    def positive_bits(self):
+        return np.packbits(self.values > 0, axis=1)
+
+    def negative_bits(self):
+        return np.packbits(self.values < 0, axis=1)
+
+    def literals(self, row):
+        """Returns the literals of a row as signed, 1-based variable indices."""
+        values = self.values[row]
+        variables = np.flatnonzero(values)
+        return ((variables + 1) * values[variables]).astype(np.int32)
+
+
+def read_dimacs(path):
+    with open(path, 'rb') as f:
+        content = f.read()
+
+    names = {}
+    variable_count = 0
+    body = []
+    for line in content.splitlines():
+        if line.startswith(b'c'):
+            # Only "c <index> <name>" names a variable, other comments are skipped
+            parts = line.split(maxsplit=2)
+            if len(parts) == 3 and parts[1].isdigit():
+                names[int(parts[1])] = parts[2].decode()
+        elif line.startswith(b'p'):
+            variable_count = int(line.split()[2])
+        else:
+            body.append(line)
+
+    tokens = b' '.join(body).split()
+    literals = np.array(tokens, dtype=np.bytes_).astype(np.int32) if tokens else np.empty(0, dtype=np.int32)
+    ends = np.flatnonzero(literals == 0)
+    sizes = np.diff(ends, prepend=-1) - 1
+    indptr = np.zeros(len(sizes) + 1, dtype=np.int64)
+    np.cumsum(sizes, out=indptr[1:])
+
+    variable_names = [names.get(i, str(i)) for i in range(1, variable_count + 1)]
+    return Clauses(variable_names, indptr, literals[literals != 0])
+
+
+def read_group(path):
+    return _read_sign_matrix(path, 2)
+
+
+def read_sample(path):
+    return _read_sign_matrix(path, 1)
+
+
+def _read_sign_matrix(path, key_columns):
+    with open(path, 'rb') as f:
+        lines = f.read().replace(b'\r', b'').split(b'\n')
+
+    header = lines[0].decode().split(';')
+    variable_names = header[key_columns:]
+    rows = [line.split(b';', key_columns) for line in lines[1:] if line]
+
+    width = 2 * len(variable_names) - 1
+    keys = np.array([row[:key_columns] for row in rows], dtype=np.int32).reshape(len(rows), key_columns)
+    cells = np.frombuffer(b''.join(row[key_columns] for row in rows), dtype=np.uint8)
+    if len(cells) != len(rows) * max(width, 0):
+        raise ValueError('Malformed rows in %s' % os.fspath(path))
+    values = _SIGNS[cells.reshape(len(rows), width)[:, ::2]] if rows else \
+        np.empty((0, len(variable_names)), dtype=np.int8)
+
+    groups = keys[:, 1] if key_columns > 1 else np.zeros(len(rows), dtype=np.int32)
+    return SignMatrix(variable_names, keys[:, 0], groups, values)
+
+
+def read_properties(path):
+    """Reads a java properties file as written by Properties.store."""
+    properties = {}
+    with open(path, encoding='latin-1') as f:
+        logical_line = ''
+        for line in f:
+            # Leading whitespace is skipped as by Properties.load, trailing whitespace belongs to the value
+            line = line.rstrip('\r\n').lstrip(' \t\f')
+            if not logical_line and (not line or line[0] in '#!'):
+                continue
+            if (len(line) - len(line.rstrip('\\'))) % 2 == 1:
+                logical_line += line[:-1]
+                continue
+            logical_line += line
+            match = _PROPERTY.match(logical_line)
+            properties[_unescape(match.group(1))] = _unescape(match.group(2))
+            logical_line = ''
+    return properties
+
+
+def _unescape(text):
+    return _ESCAPE.sub(_unescape_match, text)
+
+
+def _unescape_match(match):
+    escaped = match.group(1)
+    if len(escaped) == 5:
+        return chr(int(escaped[1:], 16))
+    return _ESCAPED_CHARACTERS.get(escaped, escaped)
@@ -0,0 +1,225 @@
+import os
+
+import pandas as pd
+
+from evalresults.config import create_out_dir
+
+METRIC_ORDER = ["default", "CF", "DF", "AF", "AFS", "ALS", "PCI",
+                "CF-DF", "CF-AF", "CF-AFS", "CF-ALS", "CF-PCI",
+                "DF-AF", "DF-AFS", "DF-ALS", "DF-PCI",
+                "AF-AFS", "AF-ALS", "AF-PCI",
+                "AFS-PCI", "ALS-PCI",
+                "CF-DF-AF", "CF-DF-AFS", "CF-DF-ALS", "CF-DF-PCI", "CF-AF-AFS", "CF-AF-ALS", "CF-AF-PCI",
+                "CF-AFS-PCI", "CF-ALS-PCI",
+                "DF-AF-AFS", "DF-AF-ALS", "DF-AF-PCI", "DF-AFS-PCI", "DF-ALS-PCI",
+                "AF-AFS-PCI", "AF-ALS-PCI",
+                "CF-DF-AF-AFS", "CF-DF-AF-ALS", "CF-DF-AF-PCI", "CF-DF-AFS-PCI", "CF-DF-ALS-PCI",
+                "DF-AF-AFS-PCI", "DF-AF-ALS-PCI",
+                "CF-DF-AF-AFS-PCI", "CF-DF-AF-ALS-PCI"
+                ]
+
+
+def metric_categories(labels):
+    """Returns the order of the given metric labels for an ordered Metric category.
+
+    Labels follow METRIC_ORDER, each with equal interactions filtered (-EFI) right after its base metric. Labels that
+    METRIC_ORDER does not know, such as those of concrete features (ConF), come last, so no label is lost.
+    """
+    observed = set(label for label in labels if isinstance(label, str))
+    categories = []
+    for metric in METRIC_ORDER:
+        categories.append(metric)
+        equal_metric = 'EFI' if metric == 'default' else metric + '-EFI'
+        if equal_metric in observed:
+            categories.append(equal_metric)
+    return categories + sorted(observed - set(categories))
+
+
+def set_display_options():
+    pd.set_option('display.max_columns', None)
+    pd.set_option('display.max_rows', None)
+    pd.set_option('display.max_colwidth', None)
+
+
+def prepare_data(config):
+    dtype_samples = {
+        'SystemID': 'int16',
+        'T': 'int8',
+        'SystemIteration': 'int8',
+        'Error': 'bool',
+        'Timeout': 'bool',
+        'Size': 'int32',
+    }
+
+    dtype_systems = {
+        'SystemID': 'int16',
+        'SystemName': 'str',
+        'VariableCount': 'int32',
+        'ClauseCount': 'int32',
+    }
+
+    dtype_time = {
+        'SystemID': 'int16',
+        'Iteration': 'str',
+        'core': 'int64',
+        'atomic': 'int64',
+    }
+
+    dtype_metrics = {
+        'MetricID': 'int16',
+        'Core': 'bool',
+        'Dead': 'bool',
+        'Abstract': 'category',
+        'Atomic': 'category',
+        'PC': 'bool',
+        'Equal': 'bool',
+    }
+
+    dtype_system_to_metric = {
+        'SystemID': 'int16',
+        'T': 'int8',
+        'SystemIteration': 'int8',
+        'ShuffleIteration': 'int8',
+        'MetricID': 'int16',
+        'FilteredVariableCount': 'int32',
+        'CoverageID': 'int32',
+        'CoverageTime': 'int64',
+        'Incremental': 'bool',
+    }
+
+    dtype_coverage = {
+        'CoverageID': 'int32',
+        'PartialSampleSize': 'int32',
+        'CoveredInteractions': 'int64',
+    }
+
+    if not os.path.exists(config.out_dir_name + 'complete.pkl'):
+        print('Reading and joining original tables')
+        system_to_metric = config.run.read_csvs("system_to_metric.csv", dtype_system_to_metric)
+        data = system_to_metric
+        data['CoverageTime'] = (data['CoverageTime'] / 1_000_000_000)
+        # Older runs have no Incremental column and were always counted completely
+        data['Incremental'] = data.get('Incremental', pd.Series(False, index=data.index)).fillna(False).astype(bool)
+
+        samples = config.run.read_csvs("samples.csv", dtype_samples).set_index(['SystemID', 'T', 'SystemIteration'])
+        data = data.join(samples, on=['SystemID', 'T', 'SystemIteration'], rsuffix="_")
+        data = data[(data['Error'] == False) &
+                    (data['Timeout'] == False)]
+        data = data[
+            ['SystemID', 'T', 'SystemIteration', 'ShuffleIteration', 'Incremental', 'MetricID', 'FilteredVariableCount',
+             'CoverageID', 'Size', 'CoverageTime']]
+
+        partial_coverage = config.run.read_csvs("partial_coverage.csv", dtype_coverage).set_index('CoverageID')
+        data = data.join(partial_coverage, on='CoverageID', rsuffix="_")
+
+        print('Joining valid interactions for specific metric')
+        key = ['SystemID', 'T', 'SystemIteration', 'ShuffleIteration', 'Incremental', 'MetricID']
+        df = data[key + ['Size', 'PartialSampleSize', 'CoveredInteractions']]
+        df = df[df['Size'] == df['PartialSampleSize']]
+        df = df[key + ['CoveredInteractions']]
+        data = data.join(df.set_index(key), on=key, rsuffix="_complete_metric")
+
+        print('Joining covered interactions for default metric')
+        key = ['SystemID', 'T', 'SystemIteration', 'ShuffleIteration', 'Incremental', 'PartialSampleSize']
+        df = data[key + ['MetricID', 'CoveredInteractions']]
+        df = df[df['MetricID'] == 1]
+        df = df[key + ['CoveredInteractions']]
+        data = data.join(df.set_index(key), on=key, rsuffix="_default")
+
+        print('Joining valid interactions for default metric')
+        key = ['SystemID', 'T', 'SystemIteration', 'ShuffleIteration', 'Incremental']
+        df = data[key + ['MetricID', 'Size', 'PartialSampleSize', 'CoveredInteractions']]
+        df = df[(df['MetricID'] == 1) & (df['Size'] == df['PartialSampleSize'])]
+        df = df[key + ['CoveredInteractions']]
+        data = data.join(df.set_index(key), on=key, rsuffix="_complete_default")
+
+        print('Computing coverage')
+        # data['Coverage'] = data['CoveredInteractions'] / data['CoveredInteractions_complete_metric']
+        data['Coverage'] = data.apply(calc_coverage, axis=1)
+        data['CoverageDiff'] = data['Coverage'] - (
+                data['CoveredInteractions_default'] / data['CoveredInteractions_complete_default'])
+        data['InteractionReduction'] = data['CoveredInteractions'] / data['CoveredInteractions_default']
+        data['RelaltivePartialSize'] = data['PartialSampleSize'] / data['Size']
+
+        data = data[
+            ['SystemID', 'T', 'SystemIteration', 'ShuffleIteration', 'Incremental', 'MetricID', 'FilteredVariableCount',
+             'Size', 'PartialSampleSize', 'CoveredInteractions', 'Coverage', 'CoverageDiff', 'InteractionReduction',
+             'RelaltivePartialSize', 'CoverageTime']]
+
+        data = data.dropna()
+
+        metrics = config.run.read_csvs("metric.csv", dtype_metrics)
+        metrics['Metric'] = metrics.apply(get_metric, axis=1)
+        # metric_order = metrics.groupby('Metric', observed=True)['MetricID'].apply(top).sort_values(ascending=True).index.tolist()
+        metrics['Metric'] = pd.Categorical(metrics['Metric'], categories=metric_categories(metrics['Metric']),
+                                           ordered=True)
+        metrics = metrics.set_index('MetricID')
+        data = data.join(metrics, on='MetricID', rsuffix="_")
+
+        analysis_time = config.run.read_csvs("analysis_time.csv", dtype_time)
+        analysis_time = analysis_time.groupby('SystemID', observed=True).agg({
+            'core': 'median',
+            'atomic': 'median'})
+        analysis_time = analysis_time.rename(columns={"core": "CoreTime", "atomic": "AtomicTime"})
+        analysis_time['CoreTime'] = (analysis_time['CoreTime'] / 1000000000)
+        analysis_time['AtomicTime'] = (analysis_time['AtomicTime'] / 1000000000)
+        data = data.join(analysis_time, on='SystemID', rsuffix="_")
+        data['MetricTime'] = data.apply(add_times, axis=1)
+
+        systems = config.run.read_csvs("systems.csv", dtype_systems).set_index('SystemID')
+        system_order = systems.groupby('SystemName', observed=True)['VariableCount'].apply(top).sort_values(
+            ascending=True).index.tolist()
+        systems['SystemName'] = pd.Categorical(systems['SystemName'], categories=system_order, ordered=True)
+        data = data.join(systems, on='SystemID', rsuffix="_")
+
+        data = data[
+            ['SystemID', 'SystemName', 'VariableCount', 'ClauseCount', 'T', 'SystemIteration', 'ShuffleIteration',
+             'Incremental', 'MetricID', 'Metric', 'CoverageTime', 'MetricTime', 'FilteredVariableCount', 'Size',
+             'PartialSampleSize', 'CoveredInteractions', 'Coverage', 'CoverageDiff', 'InteractionReduction',
+             'RelaltivePartialSize']]
+
+        print('Writing complete table')
+        create_out_dir(config)
+        data.to_pickle(config.out_dir_name + 'complete.pkl', compression='gzip')
+        systems.to_pickle(config.out_dir_name + 'systems.pkl', compression='gzip')
+        metrics.to_pickle(config.out_dir_name + 'metrics.pkl', compression='gzip')
+
+    print('Reading complete table')
+    data = config.run.load_table('complete')
+    systems = config.run.load_table('systems')
+    metrics = config.run.load_table('metrics')
+
+    print("========================================")
+    metrics.info(verbose=True, memory_usage="deep")
+    print("----------------------------------------")
+    systems.info(verbose=True, memory_usage="deep")
+    print("----------------------------------------")
+    data.info(verbose=True, memory_usage="deep")
+    print("========================================")
+
+    return [data, systems, metrics]
+
+
+def get_metric(row):
+    metric = (('CF ' if row['Core'] == True else '') + ('DF ' if row['Dead'] == True else '') + (
+        'AF ' if row['Abstract'] == 'abstrakt' else '') + ('ConF ' if row['Abstract'] == 'concrete' else '') + (
+                  'AFS ' if row['Atomic'] == 'features' else '') + ('ALS ' if row['Atomic'] == 'literals' else '') + (
+                  'PCI ' if row['PC'] == True else '') + ('EFI ' if row['Equal'] == True else '')).strip().replace(' ',
+                                                                                                                   '-')
+    return 'default' if not metric else metric
+
+
+def calc_coverage(row):
+    return (row['CoveredInteractions'] / row['CoveredInteractions_complete_metric']) if row[
+                                                                                            'CoveredInteractions_complete_metric'] != 0 else 0
+
+
+def add_times(row):
+    time = row['CoverageTime'] + ((row['CoreTime'] if row['Core'] == True or row['Dead'] == True else 0) + (
+        row['AtomicTime'] if row['Atomic'] != 'none' else 0))
+    return time
+
+
+def top(series):
+    return series.iloc[0]
+
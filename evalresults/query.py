@@ -0,0 +1,159 @@
+import os
+from functools import cached_property
+
+import pandas as pd
+
+from evalresults.prepare import metric_categories
+
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
+TABLE_NAMES = ['systems', 'metric', 'samples', 'system_to_metric', 'partial_coverage', 'analysis_time']
+
+# Same join as prepare_data, but evaluated lazily by the database
+_COVERAGE_VIEW = '''
+CREATE OR REPLACE VIEW coverage AS
+WITH partial AS (
+    SELECT m.SystemID, m.T, m.SystemIteration, m.ShuffleIteration, coalesce(%s, false) AS Incremental,
+           m.MetricID, m.FilteredVariableCount, s.Size,
+           m.CoverageTime / 1e9 AS CoverageTime, p.PartialSampleSize, p.CoveredInteractions
+    FROM system_to_metric m
+    JOIN samples s USING (SystemID, T, SystemIteration)
+    JOIN partial_coverage p USING (CoverageID)
+    WHERE NOT s.Error AND NOT s.Timeout
+), complete AS (
+    SELECT SystemID, T, SystemIteration, ShuffleIteration, Incremental, MetricID, PartialSampleSize,
+           CoveredInteractions,
+           max(CoveredInteractions) FILTER (WHERE Size = PartialSampleSize) OVER metric_run AS CompleteMetric,
+           max(CoveredInteractions) FILTER (WHERE MetricID = 1) OVER partial_size AS DefaultInteractions,
+           max(CoveredInteractions) FILTER (WHERE MetricID = 1 AND Size = PartialSampleSize) OVER run
+               AS CompleteDefault,
+           FilteredVariableCount, Size, CoverageTime
+    FROM partial
+    WINDOW run AS (PARTITION BY SystemID, T, SystemIteration, ShuffleIteration, Incremental),
+           metric_run AS (PARTITION BY SystemID, T, SystemIteration, ShuffleIteration, Incremental, MetricID),
+           partial_size AS (PARTITION BY SystemID, T, SystemIteration, ShuffleIteration, Incremental, PartialSampleSize)
+), derived AS (
+    SELECT *,
+           CASE WHEN CompleteMetric != 0 THEN CoveredInteractions / CompleteMetric ELSE 0 END AS Coverage
+    FROM complete
+    WHERE CompleteMetric IS NOT NULL AND DefaultInteractions IS NOT NULL AND CompleteDefault IS NOT NULL
+), times AS (
+    SELECT SystemID, median(core) / 1e9 AS CoreTime, median(atomic) / 1e9 AS AtomicTime
+    FROM analysis_time
+    GROUP BY SystemID
+), metrics AS (
+    SELECT MetricID, Core, Dead, Atomic, coalesce(nullif(concat_ws('-',
+               CASE WHEN Core THEN 'CF' END, CASE WHEN Dead THEN 'DF' END,
+               CASE WHEN Abstract = 'abstrakt' THEN 'AF' END, CASE WHEN Abstract = 'concrete' THEN 'ConF' END,
+               CASE WHEN Atomic = 'features' THEN 'AFS' END, CASE WHEN Atomic = 'literals' THEN 'ALS' END,
+               CASE WHEN PC THEN 'PCI' END, CASE WHEN Equal THEN 'EFI' END), ''), 'default') AS Metric
+    FROM metric
+)
+SELECT d.SystemID, y.SystemName, y.VariableCount, y.ClauseCount, d.T, d.SystemIteration, d.ShuffleIteration,
+       d.Incremental, d.MetricID, x.Metric, d.CoverageTime,
+       d.CoverageTime + CASE WHEN x.Core OR x.Dead THEN t.CoreTime ELSE 0 END
+                      + CASE WHEN x.Atomic != 'none' THEN t.AtomicTime ELSE 0 END AS MetricTime,
+       d.FilteredVariableCount, d.Size, d.PartialSampleSize, d.CoveredInteractions, d.Coverage,
+       d.Coverage - d.DefaultInteractions / d.CompleteDefault AS CoverageDiff,
+       d.CoveredInteractions / d.DefaultInteractions AS InteractionReduction,
+       d.PartialSampleSize / d.Size AS RelaltivePartialSize
+FROM derived d
+JOIN metrics x USING (MetricID)
+LEFT JOIN times t USING (SystemID)
+LEFT JOIN systems y USING (SystemID)
+WHERE NOT isnan(CoverageDiff) AND NOT isnan(InteractionReduction)
+'''
+
+
+class ResultsDatabase:
+    """Embedded SQL access to the raw csv files of a run, using DuckDB.
+
+    The csv files of all data directories are registered as the tables systems, metric, samples, system_to_metric,
+    partial_coverage, and analysis_time, and the view coverage holds the same rows as complete.pkl. By default, the
+    tables are views over the csv files, so that queries stream over the files in parallel and spill to disk next to
+    the database file instead of loading the whole run into memory. With materialize, the tables are copied into the
+    database file once and only copied again if a csv file changed.
+    """
+
+    def __init__(self, run, database=None, materialize=False, threads=None, memory_limit=None):
+        if duckdb is None:
+            raise ImportError('The query layer requires duckdb (pip3 install duckdb)')
+        self.run = run
+        self.database = database if database is not None else os.path.join(run.plot_dir_name, 'results.duckdb')
+        os.makedirs(os.path.dirname(os.path.abspath(self.database)), exist_ok=True)
+        self.connection = duckdb.connect(self.database)
+        if threads is not None:
+            self.connection.execute('SET threads = %d' % threads)
+        if memory_limit is not None:
+            self.connection.execute("SET memory_limit = '%s'" % memory_limit)
+        self._register_tables(materialize)
+
+    def _register_tables(self, materialize):
+        self.connection.execute('CREATE TABLE IF NOT EXISTS _sources (name VARCHAR PRIMARY KEY, signature VARCHAR)')
+        for name in TABLE_NAMES:
+            files = self.run.find_data_files(name + '.csv')
+            if not files:
+                raise FileNotFoundError('No %s.csv in %s' % (name, self.run.data_dir_name))
+            source = 'SELECT DISTINCT * FROM read_csv(%s, union_by_name = true)' % _sql_list(files)
+            if not materialize:
+                self._drop(name, 'BASE TABLE')
+                self.connection.execute('DELETE FROM _sources WHERE name = ?', [name])
+                self.connection.execute('CREATE OR REPLACE VIEW %s AS %s' % (name, source))
+                continue
+            signature = ';'.join('%s:%d' % (file, os.stat(file).st_mtime_ns) for file in files)
+            stored = self.connection.execute('SELECT signature FROM _sources WHERE name = ?', [name]).fetchone()
+            if stored is None or stored[0] != signature:
+                self._drop(name, 'VIEW')
+                self.connection.execute('CREATE OR REPLACE TABLE %s AS %s' % (name, source))
+                self.connection.execute('INSERT OR REPLACE INTO _sources VALUES (?, ?)', [name, signature])
+        # Older runs have no Incremental column and were always counted completely
+        columns = [row[0] for row in self.connection.execute('DESCRIBE system_to_metric').fetchall()]
+        self.connection.execute(_COVERAGE_VIEW % ('m.Incremental' if 'Incremental' in columns else 'NULL'))
+
+    def _drop(self, name, table_type):
+        if self.connection.execute('SELECT 1 FROM information_schema.tables WHERE table_name = ? AND table_type = ?',
+                                   [name, table_type]).fetchone():
+            self.connection.execute('DROP %s %s' % ('VIEW' if table_type == 'VIEW' else 'TABLE', name))
+
+    def close(self):
+        self.connection.close()
+
+    def query(self, sql, parameters=None):
+        """Runs a query and returns its result as data frame, with ordered Metric and SystemName columns."""
+        df = self.connection.execute(sql, parameters).df()
+        if 'Metric' in df.columns:
+            df['Metric'] = pd.Categorical(df['Metric'], categories=metric_categories(df['Metric']), ordered=True)
+        if 'SystemName' in df.columns:
+            df['SystemName'] = pd.Categorical(df['SystemName'], categories=self.system_order, ordered=True)
+        return df
+
+    def aggregate(self, by, aggregations, where=None, table='coverage'):
+        """Groups the rows of a table that match where and aggregates columns in the database.
+
+        aggregations maps column names to aggregate functions, such as median or first. where is a boolean
+        expression in the subset of SQL that pandas.DataFrame.query understands as well, such as
+        "T == 2 and Metric in ('default', 'CF-DF')".
+        """
+        columns = ', '.join(by + ['%s(%s) AS %s' % (function, column, column)
+                                  for column, function in aggregations.items()])
+        sql = 'SELECT %s FROM %s' % (columns, table)
+        if where:
+            sql += ' WHERE ' + where
+        sql += ' GROUP BY ALL ORDER BY ALL'
+        return self.query(sql)
+
+    def systems(self):
+        """Returns the systems table as prepare_data does."""
+        return self.query('SELECT DISTINCT * FROM systems ORDER BY SystemID').set_index('SystemID')
+
+    @cached_property
+    def system_order(self):
+        return [row[0] for row in self.connection.execute(
+            'SELECT SystemName FROM systems GROUP BY SystemName ORDER BY first(VariableCount)').fetchall()]
+
+
+def _sql_list(values):
+    return '[%s]' % ', '.join("'%s'" % value.replace("'", "''") for value in values)
@@ -0,0 +1,533 @@
+from plotnine import *
+import numpy as np
+import pandas as pd
+import matplotlib
+from scipy.stats import ttest_rel
+
+from evalresults.config import create_out_dir
+from evalresults.downsample import downsample_lines
+
+
+def set_graphics_options():
+    font = {'size': 34}
+    matplotlib.rc('font', **font)
+
+
+def create_plot(config, name, p, ratio, width=400, height=200):
+    create_out_dir(config, name)
+
+    if config.show_results:
+        p.show()
+
+    if config.save_results:
+        file_name = config.out_dir_name + name + '.pdf'
+        print('Writing ' + file_name)
+        p.save(file_name, verbose=False, width=width, height=height, units='mm', dpi=300)
+
+
+def aggregate(config, data, by, aggregations, where=None):
+    """Groups the rows that match where and aggregates them.
+
+    If config.database is set, the aggregation runs in the database and data is not used. Otherwise, the rows of data
+    are aggregated with pandas. Therefore, where must be an expression that both pandas.DataFrame.query and SQL accept.
+    """
+    if config.database is not None:
+        return config.database.aggregate(by, aggregations, where)
+    df = data.query(where) if where else data
+    return df.groupby(by, observed=True).agg(aggregations).reset_index()
+
+
+def plot_system_statistics(config, systems):
+    create_plot(config, 'system_statistics', (
+            ggplot(systems, aes('VariableCount', 'ClauseCount'))
+            + geom_point()
+            + xlab("Number of Features")
+            + ylab("Number of Clauses in CNF")
+            + theme(
+        axis_title_x=element_text(size=config.axis_title_x),
+        axis_title_y=element_text(size=config.axis_title_y),
+        strip_text_x=element_text(size=config.strip_text_x),
+        text=element_text(size=config.text),
+    )
+    ), 1)
+
+
+def plot_system_core(config, systems):
+    create_plot(config, 'system_statistics', (
+            ggplot(systems, aes('VariableCount', 'ClauseCount'))
+            + geom_point()
+            + xlab("Number of Features")
+            + ylab("Number of Clauses in CNF")
+            + theme(
+        axis_title_x=element_text(size=config.axis_title_x),
+        axis_title_y=element_text(size=config.axis_title_y),
+        strip_text_x=element_text(size=config.strip_text_x),
+        text=element_text(size=config.text),
+    )
+    ), 1)
+
+
+def plot_coverage_per_system(config, data):
+    df_plot = aggregate(config, data, ['SystemName', 'T', 'SystemIteration', 'ShuffleIteration', 'MetricID'],
+                        {'Coverage': 'median'})
+
+    create_plot(config, 'coverage_per_system', (
+            ggplot(df_plot, aes('SystemName', 'Coverage', color='factor(T)'))
+            + geom_point(raster=config.rasterize)
+            + theme(axis_text_x=element_text(rotation=30, hjust=1))
+            + facet_grid(cols='T', labeller=labeller(cols=(lambda v: 't = ' + v)))
+            + xlab("Feature Model")
+            + ylab("Interaction Reduction")
+            + theme(
+        axis_title_x=element_text(size=config.axis_title_x),
+        axis_title_y=element_text(size=config.axis_title_y),
+        strip_text_x=element_text(size=config.strip_text_x),
+        text=element_text(size=config.text),
+    )
+            + scale_color_manual(values=[config.color_t1, config.color_t2, config.color_t3])
+            + guides(color=False)
+    ), 1)
+
+
+def plot_coverage_per_metric(config, data):
+    df_plot = aggregate(config, data, ['SystemID', 'T', 'SystemIteration', 'ShuffleIteration', 'Metric'],
+                        {'Coverage': 'median'},
+                        "Metric in ('default', 'CF-DF', 'AF', 'ALS', 'CF-DF-ALS', 'PCI', 'CF-DF-AF-ALS', "
+                        "'CF-DF-AF-ALS-PCI')")
+
+    create_plot(config, 'coverage_per_metric', (
+            ggplot(df_plot, aes('Metric', 'Coverage', color='factor(T)'))
+            + geom_boxplot()
+            + theme(axis_text_x=element_text(rotation=30, hjust=1))
+            + facet_grid(cols='T', labeller=labeller(cols=(lambda v: 't = ' + v)))
+            + xlab("Metric")
+            + ylab("Coverage")
+            + theme(
+        axis_title_x=element_text(size=config.axis_title_x),
+        axis_title_y=element_text(size=config.axis_title_y),
+        strip_text_x=element_text(size=config.strip_text_x),
+        text=element_text(size=config.text),
+    )
+            + scale_y_continuous(breaks=[0.5, 0.6, 0.8, 1.0], labels=['50%', '60%', '80%', '100%'], limits=(0.5, 1.0))
+            + scale_color_manual(values=[config.color_t1, config.color_t2, config.color_t3])
+            + guides(color=False)
+    ), 1)
+
+
+def plot_relative_coverage_per_metric(config, data):
+    df_plot = aggregate(config, data, ['SystemID', 'T', 'SystemIteration', 'ShuffleIteration', 'Metric'],
+                        {'CoverageDiff': 'median'},
+                        "Metric in ('CF-DF', 'AF', 'ALS', 'CF-DF-ALS', 'PCI', 'CF-DF-AF-ALS', 'CF-DF-AF-ALS-PCI')")
+
+    annotation_df = pd.DataFrame({
+        'T': [3]
+    })
+
+    create_plot(config, 'paper/relative_coverage_per_metric', (
+            ggplot(df_plot, aes('Metric', 'CoverageDiff', color='factor(T)'))
+            + geom_boxplot()
+            + theme(axis_text_x=element_text(rotation=30, hjust=1))
+            + facet_grid(cols='T', labeller=labeller(cols=(lambda v: 't = ' + v)))
+            + xlab("Metric")
+            + ylab("Coverage Difference")
+            + scale_y_continuous(labels=lambda l: ["%d%%" % (v * 100) for v in l])
+            + theme(
+        axis_title_x=element_text(size=16),
+        axis_title_y=element_text(size=16),
+        strip_text_x=element_text(size=14),
+        text=element_text(size=14),
+    )
+            + geom_label(
+        data=annotation_df,
+        x=3,
+        y=0.11,
+        label='only 37 out of 48 models scaled for t=3',
+        fill='white',
+        color='black',
+        size=11,
+    )
+            + scale_color_manual(values=[config.color_t1, config.color_t2, config.color_t3])
+            + guides(color=False)
+    ), 1)
+
+
+def plot_interaction_reduction_per_metric(config, data):
+    df_plot = aggregate(config, data, ['SystemID', 'T', 'SystemIteration', 'ShuffleIteration', 'Metric'],
+                        {'InteractionReduction': 'median'},
+                        "Size == PartialSampleSize and Metric in ('CF-DF', 'AF', 'ALS', 'CF-DF-ALS', 'PCI', "
+                        "'CF-DF-AF-ALS', 'CF-DF-AF-ALS-PCI')")
+
+    create_plot(config, 'interaction_reduction_per_metric', (
+            ggplot(df_plot, aes('Metric', 'InteractionReduction', color='factor(T)'))
+            + geom_boxplot()
+            + theme(axis_text_x=element_text(rotation=30, hjust=1))
+            + facet_grid(cols='T', labeller=labeller(cols=(lambda v: 't = ' + v)))
+            + xlab("Metric")
+            + ylab("Interaction Ratio")
+            + theme(
+        axis_title_x=element_text(size=config.axis_title_x),
+        axis_title_y=element_text(size=config.axis_title_y),
+        strip_text_x=element_text(size=config.strip_text_x),
+        text=element_text(size=config.text),
+    )
+            + scale_color_manual(values=[config.color_t1, config.color_t2, config.color_t3])
+            + guides(color=False)
+    ), 1)
+
+
+def plot_interaction_reduction_per_metric_t2(config, data):
+    df_plot = aggregate(config, data, ['SystemID', 'T', 'SystemIteration', 'ShuffleIteration', 'Metric'],
+                        {'InteractionReduction': 'median'},
+                        "Size == PartialSampleSize and T == 2 and Metric in ('CF-DF', 'AF', 'ALS', 'CF-DF-ALS', "
+                        "'PCI', 'CF-DF-AF-ALS', 'CF-DF-AF-ALS-PCI')")
+
+    create_plot(config, 'paper/interaction_reduction_per_metric_t2', (
+            ggplot(df_plot, aes('Metric', 'InteractionReduction', color='factor(T)'))
+            + geom_boxplot()
+            + theme(axis_text_x=element_text(rotation=30, hjust=1))
+            + xlab("Metric")
+            + ylab("Percentage of Interactions")
+            + scale_y_continuous(breaks=[0.0, 0.25, 0.5, 0.75, 1.0], labels=['0%', '25%', '50%', '75%', '100%'],
+                                 limits=[0.0, 1.0])
+            + theme(
+        axis_title_x=element_text(size=config.axis_title_x),
+        axis_title_y=element_text(size=config.axis_title_y),
+        strip_text_x=element_text(size=config.strip_text_x),
+        text=element_text(size=config.text),
+    )
+            + scale_color_manual(values=[config.color_t2])
+            + guides(color=False)
+    ), 1, config.size_x, (config.size_y - 50))
+
+
+def plot_interaction_reduction_per_system(config, data):
+    df_plot = aggregate(config, data, ['SystemID', 'T', 'SystemIteration', 'ShuffleIteration', 'Metric'],
+                        {'VariableCount': 'first', 'InteractionReduction': 'median'},
+                        "Size == PartialSampleSize and Metric in ('CF-DF-AF-ALS-PCI', 'CF-DF')")
+    df_plot = df_plot.dropna()
+    df_plot['Metric'] = df_plot['Metric'].cat.remove_unused_categories()
+
+    create_plot(config, 'interaction_reduction_per_system', (
+            ggplot(df_plot, aes('VariableCount', 'InteractionReduction', color='Metric', shape='Metric'))
+            + geom_point(raster=config.rasterize)
+            + theme(axis_text_x=element_text(rotation=30, hjust=1))
+            + facet_grid(cols='T', labeller=labeller(cols=(lambda v: 't = ' + v)))
+            + scale_shape_manual(values=('o', '+', '^'))
+            + xlab("Number of Features")
+            + ylab("Interaction Ratio")
+            + theme(
+        axis_title_x=element_text(size=config.axis_title_x),
+        axis_title_y=element_text(size=config.axis_title_y),
+        strip_text_x=element_text(size=config.strip_text_x),
+        text=element_text(size=config.text),
+    )
+            + scale_color_manual(values=['#83aff0', '#090088'])
+            + guides(color=False)
+    ), 1)
+
+
+def custom_format(x, pos):
+    return f'10^{int(x)}'
+
+
+def plot_interactions_per_system(config, data):
+    df_plot = aggregate(config, data, ['SystemID', 'T', 'SystemIteration', 'ShuffleIteration', 'Metric'],
+                        {'VariableCount': 'first', 'CoveredInteractions': 'median'},
+                        "Size == PartialSampleSize and Metric in ('CF-DF-AF-ALS-PCI', 'default')")
+    df_plot = df_plot.dropna()
+    df_plot['Metric'] = df_plot['Metric'].cat.remove_unused_categories()
+    df_plot['T'] = pd.Categorical(df_plot['T'])
+
+    create_plot(config, 'paper/interactions_per_system', (
+            ggplot(df_plot, aes('VariableCount', 'CoveredInteractions', color='factor(T)', shape='Metric'))
+            + geom_point(size=4, raster=config.rasterize)
+            + theme(axis_text_x=element_text(rotation=30, hjust=1),
+                    legend_position=(0.1, 0.9),
+                    legend_box_margin=5)
+            + theme(
+        axis_title_x=element_text(size=config.axis_title_x),
+        axis_title_y=element_text(size=config.axis_title_y),
+        strip_text_x=element_text(size=config.strip_text_x),
+        text=element_text(size=config.text),
+        legend_background=element_rect(color='black')
+    )
+            + labs(color='t')
+            + scale_colour_manual(values=[config.color_t1, config.color_t2, config.color_t3])
+            + scale_shape_manual(values=['o', '+', '^'])
+            + scale_x_log10(labels=lambda x: [f'10^{int(np.log10(y))}' for y in x])
+            + scale_y_log10(labels=lambda x: [f'10^{int(np.log10(y))}' for y in x],
+                            breaks=[10 ** i for i in [1, 2, 3, 6, 9]])
+            + xlab("Number of Features")
+            + ylab("Number of Considered Interactions")
+    ), 1, config.size_x, config.size_y)
+
+
+def plot_variable_reduction_per_metric(config, data):
+    df_plot = aggregate(config, data, ['SystemID', 'Metric'],
+                        {'VariableCount': 'first', 'FilteredVariableCount': 'first'},
+                        "Size == PartialSampleSize and Metric in ('CF-DF', 'AF', 'ALS', 'CF-DF-ALS', 'PCI', "
+                        "'CF-DF-AF-ALS')")
+
+    df_plot['VariableReduction'] = df_plot['FilteredVariableCount'] / df_plot['VariableCount']
+
+    create_plot(config, 'feature_reduction_per_metric', (
+            ggplot(df_plot, aes('Metric', 'VariableReduction'))
+            + geom_boxplot()
+            + theme(axis_text_x=element_text(rotation=30, hjust=1))
+            + xlab("Metric")
+            + ylab("Feature Ratio")
+            + theme(
+        axis_title_x=element_text(size=config.axis_title_x),
+        axis_title_y=element_text(size=config.axis_title_y),
+        strip_text_x=element_text(size=config.strip_text_x),
+        text=element_text(size=config.text),
+    )
+    ), 1)
+
+
+def plot_metric_time_per_metric(config, data):
+    df_plot = aggregate(config, data, ['SystemID', 'T', 'SystemIteration', 'ShuffleIteration', 'Metric'],
+                        {'MetricTime': 'median'},
+                        "Incremental == False and Size == PartialSampleSize and Metric in ('default', 'CF-DF', 'AF', "
+                        "'ALS', 'CF-DF-ALS', 'PCI', 'CF-DF-AF-ALS', 'CF-DF-AF-ALS-PCI')")
+
+    create_plot(config, 'metric_time_per_metric', (
+            ggplot(df_plot, aes('Metric', 'MetricTime', color='factor(T)'))
+            + geom_boxplot()
+            + theme(axis_text_x=element_text(rotation=30, hjust=1))
+            + facet_grid(cols='T', labeller=labeller(cols=(lambda v: 't = ' + v)))
+            + scale_y_log10()
+            + xlab("Metric")
+            + ylab("Computation Time (s)")
+            + theme(
+        axis_title_x=element_text(size=config.axis_title_x),
+        axis_title_y=element_text(size=config.axis_title_y),
+        strip_text_x=element_text(size=config.strip_text_x),
+        text=element_text(size=config.text),
+    )
+            + scale_color_manual(values=[config.color_t1, config.color_t2, config.color_t3])
+            + guides(color=False)
+    ), 1)
+
+
+def plot_metric_time_per_metric_t2(config, data):
+    df_plot = aggregate(config, data, ['SystemID', 'T', 'SystemIteration', 'ShuffleIteration', 'Metric'],
+                        {'MetricTime': 'median'},
+                        "Incremental == False and Size == PartialSampleSize and T == 2 and Metric in ('default', "
+                        "'CF-DF', 'AF', 'ALS', 'CF-DF-ALS', 'PCI', 'CF-DF-AF-ALS', 'CF-DF-AF-ALS-PCI')")
+
+    create_plot(config, 'paper/metric_time_per_metric_t2', (
+            ggplot(df_plot, aes('Metric', 'MetricTime', color="factor(T)"))
+            + geom_boxplot()
+            + theme(axis_text_x=element_text(rotation=30, hjust=1))
+            + scale_y_log10()
+            + xlab("Metric")
+            + ylab("Computation Time (s)")
+            + theme(
+        axis_title_x=element_text(size=config.axis_title_x),
+        axis_title_y=element_text(size=config.axis_title_y),
+        strip_text_x=element_text(size=config.strip_text_x),
+        text=element_text(size=config.text),
+    )
+            + scale_color_manual(values=[config.color_t2])
+            + guides(color=False)
+    ), 1, config.size_x, (config.size_y - 50))
+
+
+def plot_metric_time_per_system(config, data):
+    df_plot = aggregate(config, data, ['SystemID', 'T', 'Metric'], {'VariableCount': 'first', 'MetricTime': 'median'},
+                        "Incremental == False and Size == PartialSampleSize and "
+                        "Metric in ('CF-DF-AF-ALS-PCI', 'default')")
+    df_plot = df_plot.dropna()
+    df_plot['Metric'] = df_plot['Metric'].cat.remove_unused_categories()
+    df_plot['T'] = pd.Categorical(df_plot['T'])
+
+    create_plot(config, 'paper/metric_time_per_system', (
+            ggplot(df_plot, aes('VariableCount', 'MetricTime', color='T', shape='Metric'))
+            + geom_point(size=4, raster=config.rasterize)
+            + theme(axis_text_x=element_text(rotation=30, hjust=1),
+                    legend_position=(0.1, 0.9),
+                    legend_box_margin=5)
+            + theme(
+        axis_title_x=element_text(size=config.axis_title_x),
+        axis_title_y=element_text(size=config.axis_title_y),
+        strip_text_x=element_text(size=config.strip_text_x),
+        text=element_text(size=config.text),
+        legend_background=element_rect(color='black')
+    )
+            + labs(color='t')
+            + scale_colour_manual(values=(config.color_t1, config.color_t2, config.color_t3))
+            + scale_shape_manual(values=('o', '+', '^'))
+            + scale_x_log10(labels=lambda x: [f'10^{int(np.log10(y))}' for y in x])
+            + scale_y_log10(breaks=[0.00001, 0.1, 1, 10, 100],
+                            limits=[0.00001, 200.0],
+                            labels=lambda x: [f'10^{int(np.log10(y))}' for y in x])
+            + xlab("Number of Features")
+            + ylab("Computation Time (s)")
+    ), 1, config.size_x, config.size_y)
+
+
+def plot_coverage_time_per_metric(config, data):
+    df_plot = aggregate(config, data, ['SystemID', 'T', 'SystemIteration', 'ShuffleIteration', 'Metric'],
+                        {'CoverageTime': 'median'},
+                        "Incremental == False and Size == PartialSampleSize and Metric in ('default', 'CF-DF', 'AF', "
+                        "'ALS', 'CF-DF-ALS', 'PCI', 'CF-DF-AF-ALS', 'CF-DF-AF-ALS-PCI')")
+
+    create_plot(config, 'coverage_time_per_metric', (
+            ggplot(df_plot, aes('Metric', 'CoverageTime', color='factor(T)'))
+            + geom_boxplot()
+            + theme(axis_text_x=element_text(rotation=30, hjust=1))
+            + facet_grid(cols='T', labeller=labeller(cols=(lambda v: 't = ' + v)))
+            + scale_y_log10()
+            + xlab("Metric")
+            + ylab("Computation Time (s)")
+            + theme(
+        axis_title_x=element_text(size=config.axis_title_x),
+        axis_title_y=element_text(size=config.axis_title_y),
+        strip_text_x=element_text(size=config.strip_text_x),
+        text=element_text(size=config.text),
+    )
+            + scale_color_manual(values=[config.color_t1, config.color_t2, config.color_t3])
+            + guides(color=False)
+    ), 1)
+
+
+def plot_coverage_time_per_system(config, data):
+    df_median = aggregate(config, data, ['VariableCount', 'T'], {'CoverageTime': 'median'},
+                          "Incremental == False and Size == PartialSampleSize")
+
+    create_plot(config, 'coverage_time_per_number_of_features', (
+            ggplot(df_median, aes('VariableCount', 'CoverageTime', color="factor(T)"))
+            + geom_point(size=3, raster=config.rasterize)
+            + theme(axis_text_x=element_text(rotation=30, hjust=1))
+            + facet_grid(cols='T', labeller=labeller(cols=(lambda v: 't = ' + str(v))))
+            + scale_y_log10()
+            + xlab("Number of Features")
+            + ylab("Computation Time (s)")
+            + theme(
+        axis_title_x=element_text(size=config.axis_title_x),
+        axis_title_y=element_text(size=config.axis_title_y),
+        strip_text_x=element_text(size=config.strip_text_x),
+        text=element_text(size=config.text),
+    )
+            + scale_color_manual(values=[config.color_t1, config.color_t2, config.color_t3])
+            + guides(color=False)
+    ), 1)
+
+
+def plot_coverage_per_partial_sample_size(config, data):
+    df_plot = aggregate(config, data, ['SystemName', 'Metric', 'PartialSampleSize'],
+                        {'Coverage': 'median', 'RelaltivePartialSize': 'median'},
+                        "T == 2 and Metric in ('default', 'CF-DF-AF-ALS-PCI')")
+    df_plot = df_plot.dropna()
+    df_plot['Metric'] = df_plot['Metric'].cat.remove_unused_categories()
+
+    df_test = df_plot.pivot(index=['SystemName', 'PartialSampleSize'], columns='Metric',
+                            values='Coverage').reset_index()
+    df_test = df_test[['SystemName', 'PartialSampleSize', 'default', 'CF-DF-AF-ALS-PCI']]
+
+    df_plot['p'] = 1.0
+    system_names = df_test['SystemName'].unique()
+    for system_name in system_names:
+        df_test_filter = df_test[df_test['SystemName'] == system_name]
+        stat, p = ttest_rel(df_test_filter['default'], df_test_filter['CF-DF-AF-ALS-PCI'])
+        df_plot.loc[df_plot['SystemName'] == system_name, 'p'] = p
+    df_plot = df_plot[df_plot['p'] < 0.05]
+    df_plot = downsample_lines(df_plot, 'RelaltivePartialSize', 'Coverage', 'SystemName', 'Metric',
+                               config.points_per_facet)
+
+    create_plot(config, 'coverage_per_partial_sample_size', (
+            ggplot(df_plot, aes('RelaltivePartialSize', 'Coverage', color='Metric'))
+            + geom_line(raster=config.rasterize)
+            + theme(axis_text_x=element_text(rotation=30, hjust=1))
+            + facet_wrap('SystemName')
+            + scale_colour_manual(values=('#83aff0', '#090088', 'green'))
+            + xlab("Relative Partial Sample Size")
+            + ylab("Pair-wise Coverage")
+            + scale_y_continuous(breaks=[0.2, 0.4, 0.6, 0.8, 1.0], labels=['20%', '40%', '60%', '80%', '100%'],
+                                 limits=[0.2, 1.0])
+            + scale_x_continuous(breaks=[0.0, 0.2, 0.4, 0.6, 0.8, 1.0],
+                                 labels=['0%', '20%', '40%', '60%', '80%', '100%'])
+            + theme(
+        axis_title_x=element_text(size=config.axis_title_x),
+        axis_title_y=element_text(size=config.axis_title_y),
+        strip_text_x=element_text(size=config.strip_text_x),
+        text=element_text(size=config.text),
+        legend_position=(1, 0),
+        legend_box_margin=5,
+        legend_margin=5,
+        legend_background=element_rect(fill='white', size=0.5, color='black')
+    )
+    ), 1, 600, 300)
+
+
+def plot_coverage_per_partial_sample_size_t2(config, data):
+    df_plot = aggregate(config, data, ['SystemName', 'Metric', 'PartialSampleSize'],
+                        {'Coverage': 'median', 'RelaltivePartialSize': 'median'},
+                        "T == 2 and SystemName in ('axTLS', 'am31_sim') and Metric in ('default', 'CF-DF-AF-ALS-PCI')")
+    df_plot = df_plot.dropna()
+    df_plot['Metric'] = df_plot['Metric'].cat.remove_unused_categories()
+
+    df_test = df_plot.pivot(index=['SystemName', 'PartialSampleSize'], columns='Metric',
+                            values='Coverage').reset_index()
+    df_test = df_test[['SystemName', 'PartialSampleSize', 'default', 'CF-DF-AF-ALS-PCI']]
+
+    df_plot['p'] = 1.0
+    system_names = df_test['SystemName'].unique()
+    for system_name in system_names:
+        df_test_filter = df_test[df_test['SystemName'] == system_name]
+        stat, p = ttest_rel(df_test_filter['default'], df_test_filter['CF-DF-AF-ALS-PCI'])
+        df_plot.loc[df_plot['SystemName'] == system_name, 'p'] = p
+    df_plot = df_plot[df_plot['p'] < 0.05]
+    df_plot = downsample_lines(df_plot, 'RelaltivePartialSize', 'Coverage', 'SystemName', 'Metric',
+                               config.points_per_facet)
+
+    custom_labels = {
+        'axTLS': 'axTLS (number of features: 96)',
+        'am31_sim': 'am31_sim (number of features: 1178)'
+    }
+
+    create_plot(config, 'paper/coverage_per_partial_sample_size_t2', (
+            ggplot(df_plot, aes('RelaltivePartialSize', 'Coverage', color='Metric'))
+            + geom_line(raster=config.rasterize)
+            + theme(axis_text_x=element_text(rotation=30, hjust=1))
+            + facet_wrap('SystemName', ncol=1, labeller=labeller(SystemName=lambda s: custom_labels[s]))
+            + scale_colour_manual(values=('#83aff0', '#090088', 'green'))
+            + xlab("Relative Partial Sample Size")
+            + ylab("Pair-wise Coverage")
+            + scale_y_continuous(breaks=[0.2, 0.4, 0.6, 0.8, 1.0], labels=['20%', '40%', '60%', '80%', '100%'],
+                                 limits=[0.2, 1.0])
+            + scale_x_continuous(breaks=[0.0, 0.2, 0.4, 0.6, 0.8, 1.0],
+                                 labels=['0%', '20%', '40%', '60%', '80%', '100%'])
+            + theme(
+        axis_title_x=element_text(size=config.axis_title_x),
+        axis_title_y=element_text(size=config.axis_title_y),
+        strip_text_x=element_text(size=config.strip_text_x),
+        text=element_text(size=config.text),
+        legend_position=(0.975, 0.025),
+        legend_box_margin=5,
+        legend_margin=5,
+        legend_background=element_rect(fill='white', size=0.5, color='black')
+    )
+    ), 1, config.size_x, config.size_y)
+
+
+def render_plots(config, data, systems):
+    set_graphics_options()
+
+    plot_system_statistics(config, systems)
+    plot_coverage_per_system(config, data)
+    plot_coverage_per_metric(config, data)
+    plot_relative_coverage_per_metric(config, data)
+    plot_interactions_per_system(config, data)
+    plot_interaction_reduction_per_metric(config, data)
+    plot_interaction_reduction_per_metric_t2(config, data)
+    plot_interaction_reduction_per_system(config, data)
+    plot_variable_reduction_per_metric(config, data)
+    plot_coverage_per_partial_sample_size(config, data)
+    plot_coverage_per_partial_sample_size_t2(config, data)
+    plot_metric_time_per_metric(config, data)
+    plot_metric_time_per_metric_t2(config, data)
+    plot_metric_time_per_system(config, data)
+    plot_coverage_time_per_metric(config, data)
+    plot_coverage_time_per_system(config, data)
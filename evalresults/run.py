@@ -0,0 +1,139 @@
+import os
+import re
+from functools import cached_property
+
+import pandas as pd
+
+from evalresults.parsers import read_dimacs, read_group, read_properties, read_sample
+
+_SAMPLE_FILE = re.compile(r'sample_t(\d+)_mi(\d+)\.csv')
+
+
+def resolve_run_dir(argv, results_dir='results'):
+    """Returns the run directory given on the command line or, if absent, the one named in results/.current."""
+    if len(argv) > 1:
+        return argv[1]
+    current = os.path.join(results_dir, '.current')
+    if os.path.exists(current):
+        with open(current) as f:
+            return os.path.join(results_dir, f.readline().strip())
+    return 'data'
+
+
+class SystemData:
+    """Lazily loaded files that PrepareFeatureModelPhase and SamplePhase wrote to gen/<system>."""
+
+    def __init__(self, path):
+        self.path = path
+        self._samples = {}
+
+    @cached_property
+    def cnf(self):
+        return read_dimacs(os.path.join(self.path, 'cnf.dimacs'))
+
+    @cached_property
+    def core(self):
+        return self.group('core')
+
+    @cached_property
+    def concrete(self):
+        return self.group('concrete')
+
+    @cached_property
+    def atomic_literals(self):
+        return self.group('atomic_literals')
+
+    @cached_property
+    def atomic_features(self):
+        return self.group('atomic_features')
+
+    @cached_property
+    def parent_child(self):
+        return self.group('parent_child')
+
+    def group(self, name):
+        """Returns the group file with the given name or None if it was not computed for this system."""
+        path = os.path.join(self.path, 'group_' + name + '.csv')
+        return read_group(path) if os.path.exists(path) else None
+
+    def sample_keys(self):
+        keys = []
+        for file_name in os.listdir(self.path):
+            match = _SAMPLE_FILE.fullmatch(file_name)
+            if match:
+                keys.append((int(match.group(1)), int(match.group(2))))
+        return sorted(keys)
+
+    def sample(self, t, iteration):
+        key = (t, iteration)
+        if key not in self._samples:
+            self._samples[key] = read_sample(os.path.join(self.path, 'sample_t%d_mi%d.csv' % key))
+        return self._samples[key]
+
+
+class Run:
+    """Access to the data/ and gen/ directories of one results/<timestamp> run."""
+
+    def __init__(self, root_dir_name):
+        self.root_dir_name = root_dir_name
+        self.data_dir_name = os.path.join(root_dir_name, 'data')
+        self.gen_dir_name = os.path.join(root_dir_name, 'gen')
+        self.plot_dir_name = os.path.join(root_dir_name, 'plot')
+        self._systems = {}
+
+    @property
+    def name(self):
+        return os.path.basename(os.path.normpath(self.root_dir_name))
+
+    @cached_property
+    def data_files(self):
+        files = {}
+        for dirpath, _, filenames in os.walk(self.data_dir_name):
+            for file_name in filenames:
+                files.setdefault(file_name, []).append(os.path.join(dirpath, file_name))
+        for paths in files.values():
+            paths.sort()
+        return files
+
+    @cached_property
+    def data_dirs(self):
+        """Maps each data-<timestamp> directory of this run to the properties of the phase that wrote it."""
+        return {os.path.basename(os.path.dirname(path)): read_properties(path)
+                for path in self.find_data_files('config.properties')}
+
+    def find_data_files(self, file_name):
+        return self.data_files.get(file_name, [])
+
+    def read_csvs(self, file_name, dtype_spec):
+        data_files = self.find_data_files(file_name)
+        data_frames = [pd.read_csv(file, dtype=dtype_spec, sep=',') for file in data_files]
+        combined_data_frame = pd.concat(data_frames, ignore_index=True)
+        combined_data_frame = combined_data_frame.drop_duplicates()
+        return combined_data_frame
+
+    def has_table(self, name):
+        return os.path.exists(os.path.join(self.plot_dir_name, name + '.pkl'))
+
+    def load_table(self, name):
+        """Reads a table that plot.py already joined and pickled, such as complete, systems, or metrics.
+
+        The table is read anew on every call and not kept by the run. Complete tables that plot.py pickled before the
+        Incremental column existed get it as False, as those runs were always counted completely.
+        """
+        df = pd.read_pickle(os.path.join(self.plot_dir_name, name + '.pkl'), compression='gzip')
+        if name == 'complete' and 'Incremental' not in df.columns:
+            columns = list(df.columns)
+            position = columns.index('ShuffleIteration') + 1 if 'ShuffleIteration' in columns else len(columns)
+            df.insert(position, 'Incremental', False)
+        return df
+
+    def system_names(self):
+        if not os.path.isdir(self.gen_dir_name):
+            return []
+        return sorted(name for name in os.listdir(self.gen_dir_name)
+                      if os.path.isdir(os.path.join(self.gen_dir_name, name)))
+
+    def system(self, name):
+        if name not in self._systems:
+            self._systems[name] = SystemData(os.path.join(self.gen_dir_name, name))
+        return self._systems[name]
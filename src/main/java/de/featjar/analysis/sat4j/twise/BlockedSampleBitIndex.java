@@ -0,0 +1,175 @@
+/*
+ * Copyright (C) 2024 FeatJAR-Development-Team
+ *
+ * This file is part of FeatJAR-formula-analysis-sat4j.
+ *
+ * formula-analysis-sat4j is free software: you can redistribute it and/or modify it
+ * under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3.0 of the License,
+ * or (at your option) any later version.
+ *
+ * formula-analysis-sat4j is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+ * See the GNU Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with formula-analysis-sat4j. If not, see <https://www.gnu.org/licenses/>.
+ *
+ * See <https://github.com/FeatureIDE/FeatJAR-formula-analysis-sat4j> for further information.
+ */
+package de.featjar.analysis.sat4j.twise;
+
+import de.featjar.formula.assignment.ABooleanAssignment;
+import java.util.Arrays;
+import java.util.List;
+import java.util.function.Predicate;
+
+/**
+ * Allocation-free alternative to {@link SampleBitIndex}.
+ * The configurations containing a literal are stored as bits in one flat word array.
+ * The array is divided into blocks of {@value #BLOCK_SIZE} configurations, such that within a block the words of one
+ * literal lie in the same cache line and the words of all literals are close to each other.
+ * Queries combine the words of all literals of an interaction one word at a time and stop as soon as the result is
+ * known.
+ *
+ * @author anonymous
+ */
+public class BlockedSampleBitIndex implements Predicate<int[]> {
+
+    private static final int BLOCK_WORDS = 8;
+    public static final int BLOCK_SIZE = BLOCK_WORDS * Long.SIZE;
+
+    private final int numberOfVariables;
+    private final int literalCount;
+    private long[] words;
+    private int allocatedBlockCount, usedBlockCount;
+    private int lastUsedWord;
+    private int sampleSize;
+
+    public BlockedSampleBitIndex(final int numberOfVariables) {
+        this.numberOfVariables = numberOfVariables;
+        literalCount = 2 * numberOfVariables + 1;
+        words = new long[0];
+        allocatedBlockCount = 0;
+        usedBlockCount = 0;
+        lastUsedWord = -1;
+        sampleSize = 0;
+    }
+
+    public BlockedSampleBitIndex(List<? extends ABooleanAssignment> sample, final int numberOfVariables) {
+        this(numberOfVariables);
+        if (!sample.isEmpty()) {
+            ensureCapacity(sample.size() - 1);
+        }
+        sample.forEach(this::addConfiguration);
+    }
+
+    private void ensureCapacity(int index) {
+        int block = index / BLOCK_SIZE;
+        if (block >= allocatedBlockCount) {
+            int newBlockCount = Math.max(block + 1, 2 * allocatedBlockCount);
+            words = Arrays.copyOf(words, Math.multiplyExact(newBlockCount, literalCount * BLOCK_WORDS));
+            allocatedBlockCount = newBlockCount;
+        }
+        if (block >= usedBlockCount) {
+            usedBlockCount = block + 1;
+        }
+        lastUsedWord = Math.max(lastUsedWord, index >> 6);
+    }
+
+    private int usedWords(int block) {
+        return block == usedBlockCount - 1 ? (lastUsedWord & (BLOCK_WORDS - 1)) + 1 : BLOCK_WORDS;
+    }
+
+    private int wordIndex(int index, int literal) {
+        return ((index / BLOCK_SIZE) * literalCount + numberOfVariables + literal) * BLOCK_WORDS
+                + ((index % BLOCK_SIZE) >>> 6);
+    }
+
+    public void addConfiguration(ABooleanAssignment config) {
+        int i = sampleSize++;
+        ensureCapacity(i);
+
+        for (int l : config.get()) {
+            if (l != 0) {
+                words[wordIndex(i, l)] |= 1L << i;
+            }
+        }
+    }
+
+    public void clear(int index) {
+        if (index / BLOCK_SIZE < usedBlockCount) {
+            long mask = ~(1L << index);
+            for (int l = -numberOfVariables; l <= numberOfVariables; l++) {
+                words[wordIndex(index, l)] &= mask;
+            }
+        }
+    }
+
+    public void set(int index, ABooleanAssignment config) {
+        for (int l : config.get()) {
+            set(index, l);
+        }
+    }
+
+    public void set(int index, int literal) {
+        if (literal != 0) {
+            ensureCapacity(index);
+            words[wordIndex(index, -literal)] &= ~(1L << index);
+            words[wordIndex(index, literal)] |= 1L << index;
+        }
+    }
+
+    @Override
+    public boolean test(int[] literals) {
+        for (int block = 0; block < usedBlockCount; block++) {
+            int blockOffset = block * literalCount + numberOfVariables;
+            for (int w = 0, n = usedWords(block); w < n; w++) {
+                if (and(literals, blockOffset, w) != 0) {
+                    return true;
+                }
+            }
+        }
+        return false;
+    }
+
+    /**
+     * {@return one plus the index of the last configuration that contains all given literals, or zero if there is no
+     * such configuration}
+     * Equivalent to {@link SampleBitIndex#index(int[])}.
+     *
+     * @param literals the literals
+     */
+    public int index(int[] literals) {
+        for (int block = usedBlockCount - 1; block >= 0; block--) {
+            int blockOffset = block * literalCount + numberOfVariables;
+            for (int w = usedWords(block) - 1; w >= 0; w--) {
+                long word = and(literals, blockOffset, w);
+                if (word != 0) {
+                    return block * BLOCK_SIZE + w * Long.SIZE + Long.SIZE - Long.numberOfLeadingZeros(word);
+                }
+            }
+        }
+        return 0;
+    }
+
+    public int size(int[] literals) {
+        int size = 0;
+        for (int block = 0; block < usedBlockCount; block++) {
+            int blockOffset = block * literalCount + numberOfVariables;
+            for (int w = 0, n = usedWords(block); w < n; w++) {
+                size += Long.bitCount(and(literals, blockOffset, w));
+            }
+        }
+        return size;
+    }
+
+    private long and(int[] literals, int blockOffset, int w) {
+        long word = words[(blockOffset + literals[0]) * BLOCK_WORDS + w];
+        for (int k = 1; k < literals.length && word != 0; k++) {
+            word &= words[(blockOffset + literals[k]) * BLOCK_WORDS + w];
+        }
+        return word;
+    }
+}
@@ -84,7 +84,7 @@ public class RelativeTWiseCoverageComputation extends AComputation<CoverageStati
             t = T.get(dependencyList);
             size = sample.get(0).get().size();
 
-            SampleBitIndex referenceIndex = new SampleBitIndex(referenceSample.getAll(), size);
+            BlockedSampleBitIndex referenceIndex = new BlockedSampleBitIndex(referenceSample.getAll(), size);
 
             final int[] literals = Ints.filteredList(size, FILTER.get(dependencyList));
             final int[] gray = Ints.grayCode(t);
@@ -105,7 +105,7 @@ public class TWiseCountComputation extends AComputation<Long> {
         final int[] literals = Ints.filteredList(size, VARIABLE_FILTER.get(dependencyList));
         final int[] gray = Ints.grayCode(t);
 
-        SampleBitIndex coverageChecker = new SampleBitIndex(sample, size);
+        BlockedSampleBitIndex coverageChecker = new BlockedSampleBitIndex(sample, size);
 
         LexicographicIterator.parallelStream(t, literals.length, this::createStatistic)
                 .forEach(combo -> {
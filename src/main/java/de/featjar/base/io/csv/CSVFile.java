@@ -318,6 +318,18 @@ public class CSVFile {
         return this;
     }
 
+    /**
+     * Flushes all new lines and closes this CSV file's output.
+     *
+     * @throws IOException if the output cannot be closed
+     */
+    public void close() throws IOException {
+        flush();
+        if (output != null) {
+            output.close();
+        }
+    }
+
     private String printLine(List<String> line) {
         final StringBuilder sb = new StringBuilder();
         for (final String value : line) {
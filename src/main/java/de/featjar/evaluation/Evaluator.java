@@ -28,6 +28,7 @@ import de.featjar.base.cli.OptionList;
 import de.featjar.base.cli.RangeOption;
 import de.featjar.base.io.csv.CSVFile;
 import de.featjar.evaluation.util.OptionCombiner;
+import de.featjar.evaluation.util.Telemetry;
 import java.io.IOException;
 import java.io.OutputStream;
 import java.nio.charset.StandardCharsets;
@@ -73,6 +74,15 @@ public abstract class Evaluator extends ACommand {
 
     public static final Option<Boolean> overwrite = Option.newOption("overwrite", Option.BooleanParser, Boolean.FALSE);
 
+    public static final Option<Long> telemetryIntervalOption = Option.newOption(
+                    "telemetry_interval", Option.LongParser, 0L)
+            .setDescription(
+                    "Interval in seconds in which counters, throughput, heap use, and thread utilization are appended to telemetry.csv and telemetry_threads.csv. 0 disables telemetry.");
+    public static final Option<Integer> telemetryPortOption = Option.newOption(
+                    "telemetry_port", Option.IntegerParser, -1)
+            .setDescription(
+                    "Local port at which the latest telemetry is served under /metrics. A negative value disables the endpoint.");
+
     public static final ListOption<String> systemsOption =
             (ListOption<String>) Option.newListOption("systems", Option.StringParser)
                     .setDescription("The systems considered in the evaluation.");
@@ -162,10 +172,21 @@ public abstract class Evaluator extends ACommand {
                 properties.store(newOutputStream, null);
             }
 
+            long telemetryInterval = optionParser.get(telemetryIntervalOption);
+            if (telemetryInterval > 0) {
+                try {
+                    Telemetry.start(csvPath, telemetryInterval, optionParser.get(telemetryPortOption));
+                } catch (final IOException e) {
+                    FeatJAR.log().warning("Could not start telemetry, continuing without it: %s", e.getMessage());
+                    Telemetry.stop();
+                }
+            }
+
             runEvaluation();
         } catch (final Exception e) {
             FeatJAR.log().error(e);
         } finally {
+            Telemetry.stop();
             FeatJAR.log().dispose();
             dispose();
         }
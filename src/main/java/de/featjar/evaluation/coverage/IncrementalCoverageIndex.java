@@ -0,0 +1,439 @@
+/*
+ * Copyright (C) 2024 FeatJAR-Development-Team
+ *
+ * This file is part of FeatJAR-evaluation-coverage-metrics.
+ *
+ * evaluation-coverage-metrics is free software: you can redistribute it and/or modify it
+ * under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3.0 of the License,
+ * or (at your option) any later version.
+ *
+ * evaluation-coverage-metrics is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+ * See the GNU Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with evaluation-coverage-metrics. If not, see <https://www.gnu.org/licenses/>.
+ *
+ * See <https://github.com/FeatJAR> for further information.
+ */
+package de.featjar.evaluation.coverage;
+
+import de.featjar.base.data.BinomialCalculator;
+import de.featjar.base.data.LexicographicIterator;
+import de.featjar.base.data.Result;
+import de.featjar.evaluation.util.Telemetry;
+import de.featjar.formula.assignment.ABooleanAssignment;
+import java.io.BufferedInputStream;
+import java.io.BufferedOutputStream;
+import java.io.DataInputStream;
+import java.io.DataOutputStream;
+import java.io.IOException;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.Collection;
+import java.util.List;
+import java.util.concurrent.atomic.AtomicLongArray;
+import java.util.concurrent.atomic.AtomicReferenceArray;
+import java.util.zip.GZIPInputStream;
+import java.util.zip.GZIPOutputStream;
+
+/**
+ * Persistent set of the interactions covered by a sample, which can be extended by appended configurations.
+ * Each interaction is stored as a single bit, addressed by the lexicographic index of its variable combination and
+ * the sign pattern of its literals. Thus, all 2^t interactions of one variable combination lie in the same word.
+ * The words are split into pages of 512 KiB, which are only allocated and saved once they contain a covered
+ * interaction. Every configuration without unassigned variables covers one interaction of each variable combination,
+ * so the index of a sample needs up to {@link #estimateSize(int, int)} bytes. Callers should check this size before
+ * counting.
+ * Interactions that should not be counted (e.g., filtered parent-child interactions) are marked as covered from the
+ * start.
+ * For every configuration, the index records the number of interactions it newly covered, such that the coverage of
+ * every prefix of the sample is known without a recount.
+ * A stored index is only loaded again for the same metric and the same filtered interactions.
+ *
+ * @author anonymous
+ */
+public class IncrementalCoverageIndex {
+
+    private static final int VERSION = 3;
+
+    private static final int PAGE_SHIFT = 16;
+    private static final int PAGE_SIZE = 1 << PAGE_SHIFT;
+    private static final int PAGE_MASK = PAGE_SIZE - 1;
+
+    private class Environment {
+        private final long[] statistic;
+        private final Telemetry.Tally tally = new Telemetry.Tally();
+
+        private Environment(int newConfigurationCount) {
+            statistic = new long[newConfigurationCount];
+        }
+    }
+
+    private final int t;
+    private final int[] literals;
+    private final String metricKey;
+    private final long filterHash;
+    private final long wordCount;
+    private final AtomicReferenceArray<AtomicLongArray> pages;
+
+    private long[] statistic;
+    private long sampleHash;
+
+    private int newConfigurationCount;
+    private final ArrayList<Environment> statisticList = new ArrayList<>();
+
+    /**
+     * Creates an empty index.
+     *
+     * @param t the interaction size, at most 6
+     * @param literals the (positive) variables that are considered for interactions
+     * @param metricKey the options of the metric this index is computed for
+     * @param filterCombinations the interactions that should never be counted
+     */
+    public IncrementalCoverageIndex(
+            int t, int[] literals, String metricKey, Collection<int[]> filterCombinations) {
+        this(
+                t,
+                literals,
+                metricKey,
+                hash(filterCombinations),
+                new AtomicReferenceArray<>(pageCount(wordCount(t, literals.length))),
+                new long[0],
+                0);
+        int[] positions = new int[literals.length == 0 ? 0 : Arrays.stream(literals).max().getAsInt() + 1];
+        Arrays.fill(positions, -1);
+        for (int i = 0; i < literals.length; i++) {
+            positions[literals[i]] = i;
+        }
+        BinomialCalculator binomialCalculator = new BinomialCalculator(t, literals.length);
+        for (int[] interaction : filterCombinations) {
+            markCovered(interaction, positions, binomialCalculator);
+        }
+    }
+
+    private IncrementalCoverageIndex(
+            int t,
+            int[] literals,
+            String metricKey,
+            long filterHash,
+            AtomicReferenceArray<AtomicLongArray> pages,
+            long[] statistic,
+            long sampleHash) {
+        if (t < 1 || t > 6) {
+            throw new IllegalArgumentException("t must be between 1 and 6, but was " + t);
+        }
+        this.t = t;
+        this.literals = literals;
+        this.metricKey = metricKey;
+        this.filterHash = filterHash;
+        this.wordCount = wordCount(t, literals.length);
+        this.pages = pages;
+        this.statistic = statistic;
+        this.sampleHash = sampleHash;
+    }
+
+    /**
+     * {@return the number of bytes that the index of a sample needs at most in memory, or Long.MAX_VALUE if this
+     * number exceeds the range of long}
+     *
+     * @param t the interaction size
+     * @param n the number of variables that are considered for interactions
+     */
+    public static long estimateSize(int t, int n) {
+        try {
+            return Math.multiplyExact(wordCount(t, n), Long.BYTES);
+        } catch (ArithmeticException e) {
+            return Long.MAX_VALUE;
+        }
+    }
+
+    private static long wordCount(int t, int n) {
+        return Math.addExact(Math.multiplyExact(BinomialCalculator.computeBinomial(n, t), 1L << t), 63) >>> 6;
+    }
+
+    private static int pageCount(long wordCount) {
+        long pageCount = (wordCount + PAGE_SIZE - 1) >>> PAGE_SHIFT;
+        if (pageCount > Integer.MAX_VALUE) {
+            throw new IllegalArgumentException(
+                    String.format("Too many interactions for an index (%d words)", wordCount));
+        }
+        return (int) pageCount;
+    }
+
+    private long getWord(long word) {
+        AtomicLongArray page = pages.get((int) (word >>> PAGE_SHIFT));
+        return page == null ? 0 : page.get((int) (word & PAGE_MASK));
+    }
+
+    private void setBits(long word, long bits) {
+        int pageIndex = (int) (word >>> PAGE_SHIFT);
+        AtomicLongArray page = pages.get(pageIndex);
+        if (page == null) {
+            pages.compareAndSet(pageIndex, null, new AtomicLongArray(getPageLength(wordCount, pageIndex)));
+            page = pages.get(pageIndex);
+        }
+        page.getAndAccumulate((int) (word & PAGE_MASK), bits, (a, b) -> a | b);
+    }
+
+    private static int getPageLength(long wordCount, int pageIndex) {
+        return (int) Math.min(PAGE_SIZE, wordCount - ((long) pageIndex << PAGE_SHIFT));
+    }
+
+    private void markCovered(int[] interaction, int[] positions, BinomialCalculator binomialCalculator) {
+        if (interaction.length != t) {
+            return;
+        }
+        int[] combination = new int[t];
+        int[] sortedInteraction = new int[t];
+        for (int j = 0; j < t; j++) {
+            int variable = Math.abs(interaction[j]);
+            if (variable >= positions.length || positions[variable] < 0) {
+                return;
+            }
+            int k = j;
+            for (; k > 0 && combination[k - 1] > positions[variable]; k--) {
+                combination[k] = combination[k - 1];
+                sortedInteraction[k] = sortedInteraction[k - 1];
+            }
+            combination[k] = positions[variable];
+            sortedInteraction[k] = interaction[j];
+        }
+        int pattern = 0;
+        for (int j = 0; j < t; j++) {
+            if (sortedInteraction[j] > 0) {
+                pattern |= 1 << j;
+            }
+        }
+        long bit = (binomialCalculator.index(combination) << t) + pattern;
+        setBits(bit >>> 6, 1L << (bit & 63));
+    }
+
+    /**
+     * {@return the number of configurations that were already added to this index}
+     */
+    public int getConfigurationCount() {
+        return statistic.length;
+    }
+
+    /**
+     * {@return the number of newly covered interactions for each added configuration}
+     */
+    public long[] getStatistic() {
+        return Arrays.copyOf(statistic, statistic.length);
+    }
+
+    /**
+     * {@return whether the configurations in this index are the first configurations of the given sample}
+     * Only then, the index can be extended by the remaining configurations.
+     *
+     * @param sample the sample
+     */
+    public boolean isPrefixOf(List<? extends ABooleanAssignment> sample) {
+        return sample.size() >= statistic.length && hash(sample, statistic.length) == sampleHash;
+    }
+
+    /**
+     * Adds all configurations of the given sample that are not yet contained in this index.
+     * For each new configuration, only the interactions that are not covered by a previous configuration are counted.
+     *
+     * @param sample the sample, starting with the configurations already contained in this index
+     * @return the number of newly covered interactions for each configuration of the sample
+     */
+    public long[] extend(List<? extends ABooleanAssignment> sample) {
+        if (!isPrefixOf(sample)) {
+            throw new IllegalArgumentException("Index does not belong to a prefix of the given sample");
+        }
+        int start = statistic.length;
+        int[][] configurations = sample.subList(start, sample.size()).stream()
+                .map(ABooleanAssignment::get)
+                .toArray(int[][]::new);
+        newConfigurationCount = configurations.length;
+        statisticList.clear();
+
+        if (configurations.length > 0 && literals.length >= t) {
+            Telemetry.startTask(
+                    getClass().getSimpleName(), BinomialCalculator.computeBinomial(literals.length, t));
+            LexicographicIterator.parallelStream(t, literals.length, this::createStatistic)
+                    .forEach(combo -> {
+                        long bit = combo.index() << t;
+                        long word = bit >>> 6;
+                        int offset = (int) (bit & 63);
+                        long covered = getWord(word);
+                        long added = 0;
+                        int addedCount = 0;
+                        int[] elementIndices = combo.elementIndices;
+                        configurationLoop:
+                        for (int c = 0; c < configurations.length; c++) {
+                            int[] configuration = configurations[c];
+                            int pattern = 0;
+                            for (int j = 0; j < t; j++) {
+                                int value = configuration[literals[elementIndices[j]] - 1];
+                                if (value == 0) {
+                                    continue configurationLoop;
+                                }
+                                if (value > 0) {
+                                    pattern |= 1 << j;
+                                }
+                            }
+                            long mask = 1L << (offset + pattern);
+                            if (((covered | added) & mask) == 0) {
+                                added |= mask;
+                                addedCount++;
+                                combo.environment.statistic[c]++;
+                            }
+                        }
+                        if (added != 0) {
+                            setBits(word, added);
+                        }
+                        combo.environment.tally.add(1, addedCount);
+                    });
+            statisticList.forEach(env -> env.tally.flush());
+            Telemetry.endTask();
+        }
+
+        long[] newStatistic = Arrays.copyOf(statistic, sample.size());
+        statisticList.forEach(env -> {
+            for (int c = 0; c < env.statistic.length; c++) {
+                newStatistic[start + c] += env.statistic[c];
+            }
+        });
+        statistic = newStatistic;
+        sampleHash = hash(sample, sample.size());
+        return getStatistic();
+    }
+
+    private Environment createStatistic() {
+        Environment env = new Environment(newConfigurationCount);
+        synchronized (statisticList) {
+            statisticList.add(env);
+        }
+        return env;
+    }
+
+    private static long hash(List<? extends ABooleanAssignment> sample, int count) {
+        long hash = 1;
+        for (int i = 0; i < count; i++) {
+            hash = 31 * hash + Arrays.hashCode(sample.get(i).get());
+        }
+        return hash;
+    }
+
+    /**
+     * {@return an order-independent hash of the given interactions}
+     *
+     * @param filterCombinations the interactions
+     */
+    private static long hash(Collection<int[]> filterCombinations) {
+        long hash = filterCombinations.size();
+        for (int[] interaction : filterCombinations) {
+            int[] sortedInteraction = Arrays.copyOf(interaction, interaction.length);
+            Arrays.sort(sortedInteraction);
+            long interactionHash = 1;
+            for (int literal : sortedInteraction) {
+                interactionHash = 31 * interactionHash + literal;
+            }
+            hash += interactionHash * 0x9E3779B97F4A7C15L;
+        }
+        return hash;
+    }
+
+    /**
+     * Writes this index to a file.
+     *
+     * @param path the file
+     * @throws IOException if the file cannot be written
+     */
+    public void save(Path path) throws IOException {
+        try (DataOutputStream out = new DataOutputStream(
+                new BufferedOutputStream(new GZIPOutputStream(Files.newOutputStream(path))))) {
+            out.writeInt(VERSION);
+            out.writeInt(t);
+            out.writeUTF(metricKey);
+            out.writeLong(filterHash);
+            out.writeInt(literals.length);
+            for (int literal : literals) {
+                out.writeInt(literal);
+            }
+            out.writeLong(sampleHash);
+            out.writeInt(statistic.length);
+            for (long count : statistic) {
+                out.writeLong(count);
+            }
+            out.writeLong(wordCount);
+            for (int i = 0; i < pages.length(); i++) {
+                AtomicLongArray page = pages.get(i);
+                if (page != null) {
+                    out.writeInt(i);
+                    for (int j = 0; j < page.length(); j++) {
+                        out.writeLong(page.get(j));
+                    }
+                }
+            }
+            out.writeInt(-1);
+        }
+    }
+
+    /**
+     * Reads an index from a file.
+     *
+     * @param path the file
+     * @param t the expected interaction size
+     * @param literals the expected variables
+     * @param metricKey the options of the expected metric
+     * @param filterCombinations the expected interactions that should never be counted
+     * @return the index or an empty result, if the file does not exist, cannot be read, or was computed for a
+     *         different t, different variables, a different metric, or different filtered interactions
+     */
+    public static Result<IncrementalCoverageIndex> load(
+            Path path, int t, int[] literals, String metricKey, Collection<int[]> filterCombinations) {
+        if (!Files.isReadable(path)) {
+            return Result.empty();
+        }
+        try (DataInputStream in = new DataInputStream(
+                new BufferedInputStream(new GZIPInputStream(Files.newInputStream(path))))) {
+            if (in.readInt() != VERSION || in.readInt() != t) {
+                return Result.empty();
+            }
+            long filterHash = hash(filterCombinations);
+            if (!in.readUTF().equals(metricKey) || in.readLong() != filterHash) {
+                return Result.empty();
+            }
+            int[] storedLiterals = new int[in.readInt()];
+            for (int i = 0; i < storedLiterals.length; i++) {
+                storedLiterals[i] = in.readInt();
+            }
+            if (!Arrays.equals(storedLiterals, literals)) {
+                return Result.empty();
+            }
+            long sampleHash = in.readLong();
+            long[] statistic = new long[in.readInt()];
+            for (int i = 0; i < statistic.length; i++) {
+                statistic[i] = in.readLong();
+            }
+            long wordCount = wordCount(t, storedLiterals.length);
+            if (in.readLong() != wordCount) {
+                return Result.empty();
+            }
+            AtomicReferenceArray<AtomicLongArray> pages = new AtomicReferenceArray<>(pageCount(wordCount));
+            for (int pageIndex = in.readInt(); pageIndex >= 0; pageIndex = in.readInt()) {
+                if (pageIndex >= pages.length()) {
+                    return Result.empty();
+                }
+                long[] page = new long[getPageLength(wordCount, pageIndex)];
+                for (int j = 0; j < page.length; j++) {
+                    page[j] = in.readLong();
+                }
+                pages.set(pageIndex, new AtomicLongArray(page));
+            }
+            return Result.of(new IncrementalCoverageIndex(
+                    t, storedLiterals, metricKey, filterHash, pages, statistic, sampleHash));
+        } catch (IOException e) {
+            return Result.empty(e);
+        }
+    }
+}
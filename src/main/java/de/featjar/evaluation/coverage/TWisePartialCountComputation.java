@@ -20,24 +20,33 @@
  */
 package de.featjar.evaluation.coverage;
 
-import de.featjar.analysis.sat4j.twise.SampleBitIndex;
+import de.featjar.analysis.sat4j.twise.BlockedSampleBitIndex;
 import de.featjar.base.computation.AComputation;
 import de.featjar.base.computation.Computations;
 import de.featjar.base.computation.Dependency;
 import de.featjar.base.computation.IComputation;
 import de.featjar.base.computation.Progress;
+import de.featjar.base.data.BinomialCalculator;
+import de.featjar.base.data.IntegerList;
 import de.featjar.base.data.Ints;
 import de.featjar.base.data.LexicographicIterator;
 import de.featjar.base.data.Result;
+import de.featjar.evaluation.util.Telemetry;
 import de.featjar.formula.assignment.ABooleanAssignment;
 import de.featjar.formula.assignment.ABooleanAssignmentList;
 import de.featjar.formula.assignment.BooleanAssignment;
 import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.HashSet;
 import java.util.List;
+import java.util.Set;
 
 /**
  * Calculates statistics regarding t-wise feature coverage of a set of
  * solutions.
+ * If {@link #EQUAL_LITERALS} contains atomic sets, every literal is mapped to the representative of its atomic set and
+ * each canonical interaction is counted only once. Interactions that contain several literals of the same atomic set
+ * are counted as their smaller canonical interaction.
  *
  * @author anonymous
  */
@@ -64,9 +73,12 @@ public class TWisePartialCountComputation extends AComputation<long[]> {
             Dependency.newDependency(BooleanAssignment.class);
     public static final Dependency<CombinationList> COMBINATION_FILTER =
             Dependency.newDependency(CombinationList.class);
+    public static final Dependency<CombinationList> EQUAL_LITERALS =
+            Dependency.newDependency(CombinationList.class);
 
     public class Environment {
         private long[] statistic = new long[sampleSize];
+        private Telemetry.Tally tally = new Telemetry.Tally();
 
         public long[] getStatistic() {
             return statistic;
@@ -79,6 +91,7 @@ public class TWisePartialCountComputation extends AComputation<long[]> {
                 sample,
                 Computations.of(2), //
                 Computations.of(new BooleanAssignment()), //
+                Computations.of(new CombinationList(List.of())), //
                 Computations.of(new CombinationList(List.of())));
     }
 
@@ -106,40 +119,145 @@ public class TWisePartialCountComputation extends AComputation<long[]> {
         t = T.get(dependencyList);
 
         final int[] literals = Ints.filteredList(size, VARIABLE_FILTER.get(dependencyList));
+        final int[] canonical = getCanonicalLiterals(size, literals, EQUAL_LITERALS.get(dependencyList).set);
+        final int[] classSizes = new int[size + 1];
+        for (int literal : literals) {
+            classSizes[Math.abs(canonical[literal])]++;
+        }
+        final int[] representatives =
+                Arrays.stream(literals).filter(l -> canonical[l] == l).toArray();
         final int[] gray = Ints.grayCode(t);
 
-        SampleBitIndex coverageChecker = new SampleBitIndex(sample, size);
+        BlockedSampleBitIndex coverageChecker = new BlockedSampleBitIndex(sample, size);
+
+        long combinationCount = BinomialCalculator.computeBinomial(representatives.length, t);
+        if (representatives.length < literals.length) {
+            for (int k = 1; k < t; k++) {
+                combinationCount += BinomialCalculator.computeBinomial(representatives.length, k);
+            }
+        }
+        Telemetry.startTask(getClass().getSimpleName(), combinationCount);
 
-        LexicographicIterator.parallelStream(t, literals.length, this::createStatistic)
+        LexicographicIterator.parallelStream(t, representatives.length, this::createStatistic)
                 .forEach(combo -> {
-                    int[] select = combo.getSelection(literals);
+                    int[] select = combo.getSelection(representatives);
+                    int covered = 0;
                     for (int g : gray) {
                         int index = coverageChecker.index(select);
                         if (index > 0) {
                             combo.environment.statistic[index - 1]++;
+                            covered++;
                         }
                         select[g] = -select[g];
                     }
+                    combo.environment.tally.add(1, covered);
                 });
 
+        if (representatives.length < literals.length) {
+            for (int k = 1; k < t; k++) {
+                final int[] smallerGray = Ints.grayCode(k);
+                LexicographicIterator.parallelStream(k, representatives.length, this::createStatistic)
+                        .forEach(combo -> {
+                            int[] select = combo.getSelection(representatives);
+                            int variableCount = 0;
+                            for (int l : select) {
+                                variableCount += classSizes[l];
+                            }
+                            int covered = 0;
+                            if (variableCount >= t) {
+                                for (int g : smallerGray) {
+                                    int index = coverageChecker.index(select);
+                                    if (index > 0) {
+                                        combo.environment.statistic[index - 1]++;
+                                        covered++;
+                                    }
+                                    select[g] = -select[g];
+                                }
+                            }
+                            combo.environment.tally.add(1, covered);
+                        });
+            }
+        }
+
         long[] result = new long[sampleSize];
 
-        filterCombinations.forEach(combo -> {
-            int index = coverageChecker.index(combo);
+        Set<IntegerList> canonicalFilterCombinations = new HashSet<>();
+        for (int[] combo : filterCombinations) {
+            int[] canonicalCombo = getCanonicalInteraction(combo, canonical);
+            if (canonicalCombo != null) {
+                canonicalFilterCombinations.add(new IntegerList(canonicalCombo));
+            }
+        }
+        canonicalFilterCombinations.forEach(combo -> {
+            int index = coverageChecker.index(combo.get());
             if (index > 0) {
                 result[index - 1]--;
             }
         });
         statisticList.forEach(env -> {
+            env.tally.flush();
             long[] statistic = env.getStatistic();
             for (int i = 0; i < result.length; i++) {
                 result[i] += statistic[i];
             }
         });
 
+        Telemetry.endTask();
         return Result.of(result);
     }
 
+    /**
+     * {@return the signed representative literal of each variable, or 0 for filtered variables}
+     * The representative of an atomic set is its first unfiltered literal.
+     *
+     * @param size the number of variables
+     * @param literals the unfiltered variables
+     * @param atomicSets the atomic sets of literals
+     */
+    private static int[] getCanonicalLiterals(int size, int[] literals, List<int[]> atomicSets) {
+        int[] canonical = new int[size + 1];
+        for (int literal : literals) {
+            canonical[literal] = literal;
+        }
+        for (int[] atomicSet : atomicSets) {
+            int representative = 0;
+            for (int literal : atomicSet) {
+                int variable = Math.abs(literal);
+                if (canonical[variable] != 0) {
+                    if (representative == 0) {
+                        representative = literal;
+                    }
+                    canonical[variable] = literal > 0 ? representative : -representative;
+                }
+            }
+        }
+        return canonical;
+    }
+
+    /**
+     * {@return the sorted and duplicate-free canonical literals of an interaction, or null if the interaction
+     * contains a filtered variable or is contradictory under the atomic sets}
+     *
+     * @param interaction the literals of the interaction
+     * @param canonical the representative literal of each variable
+     */
+    private static int[] getCanonicalInteraction(int[] interaction, int[] canonical) {
+        int[] canonicalInteraction = new int[interaction.length];
+        for (int i = 0; i < interaction.length; i++) {
+            int literal = interaction[i];
+            int representative = canonical[Math.abs(literal)];
+            if (representative == 0) {
+                return null;
+            }
+            canonicalInteraction[i] = literal > 0 ? representative : -representative;
+        }
+        canonicalInteraction = Arrays.stream(canonicalInteraction).distinct().sorted().toArray();
+        if (Arrays.stream(canonicalInteraction).map(Math::abs).distinct().count() < canonicalInteraction.length) {
+            return null;
+        }
+        return canonicalInteraction;
+    }
+
     private Environment createStatistic() {
         Environment env = new Environment();
         synchronized (statisticList) {
@@ -30,7 +30,9 @@ import de.featjar.base.data.LexicographicIterator;
 import de.featjar.base.io.IO;
 import de.featjar.base.io.csv.CSVFile;
 import de.featjar.evaluation.Evaluator;
+import de.featjar.evaluation.coverage.IncrementalCoverageIndex;
 import de.featjar.evaluation.coverage.TWisePartialCountComputation;
+import de.featjar.evaluation.util.Telemetry;
 import de.featjar.formula.assignment.ABooleanAssignment;
 import de.featjar.formula.assignment.BooleanAssignment;
 import de.featjar.formula.assignment.BooleanAssignmentGroups;
@@ -42,6 +44,7 @@ import de.featjar.formula.io.csv.BooleanSolutionListCSVFormat;
 import java.io.IOException;
 import java.nio.file.Path;
 import java.util.ArrayList;
+import java.util.Collection;
 import java.util.Collections;
 import java.util.LinkedHashMap;
 import java.util.List;
@@ -83,6 +86,20 @@ public class PartialCoveragePhase extends Evaluator {
     public static final ListOption<Boolean> equalOption =
             Option.newListOption("filter_equal_interactions", Option.BooleanParser);
 
+    public static final Option<Boolean> incrementalOption = Option.newOption(
+                    "incremental", Option.BooleanParser, Boolean.FALSE)
+            .setDescription("Keeps the covered interactions of each sample and metric in the gen folder and only counts "
+                    + "interactions of newly appended configurations. Samples are not shuffled in this mode, so it "
+                    + "requires shuffleIterations=1. "
+                    + "Metrics that filter equal interactions are always counted completely. "
+                    + "Partial samples are the first instead of the last configurations of a sample, and CoverageTime "
+                    + "only measures loading the index and counting the appended configurations. "
+                    + "Such rows are marked in the Incremental column of system_to_metric.csv.");
+    public static final Option<Integer> incrementalIndexLimitOption = Option.newOption(
+                    "incremental_index_limit", Option.IntegerParser, 1024)
+            .setDescription("Maximum size in MiB of the index of one sample and metric in incremental mode. Metrics "
+                    + "with a larger index are counted completely, without an index.");
+
     private String modelName;
     private Path modelPath;
     private int metricID, modelID, coverageID, modelIteration, shuffleIteration, t;
@@ -101,6 +118,10 @@ public class PartialCoveragePhase extends Evaluator {
 
     @Override
     public void runEvaluation() {
+        if (optionParser.get(incrementalOption) && optionParser.get(shuffleIterationsOption).size() > 1) {
+            FeatJAR.log().error("incremental=true requires shuffleIterations=1, because samples are not shuffled");
+            return;
+        }
         try {
             metricCSV = new CSVFile(csvPath.resolve("metric.csv"));
             metricCSV.setHeaderFields("MetricID", "Core", "Dead", "Abstract", "Atomic", "PC", "Equal");
@@ -125,7 +146,8 @@ public class PartialCoveragePhase extends Evaluator {
                     "MetricID",
                     "FilteredVariableCount",
                     "CoverageID",
-                    "CoverageTime");
+                    "CoverageTime",
+                    "Incremental");
 
             partialCoverageCSV = new CSVFile(csvPath.resolve("partial_coverage.csv"));
             partialCoverageCSV.setHeaderFields("CoverageID", "PartialSampleSize", "CoveredInteractions");
@@ -219,7 +241,9 @@ public class PartialCoveragePhase extends Evaluator {
             case 3:
                 shuffleIteration = optionCombiner.getValue(3);
                 shuffledSample = sample.getAll();
-                Collections.shuffle(shuffledSample, new Random(optionParser.get(randomSeed) + shuffleIteration));
+                if (!optionParser.get(incrementalOption)) {
+                    Collections.shuffle(shuffledSample, new Random(optionParser.get(randomSeed) + shuffleIteration));
+                }
             case 4:
                 core = optionCombiner.getValue(4);
             case 5:
@@ -289,15 +313,44 @@ public class PartialCoveragePhase extends Evaluator {
                     }
                 }
 
-                coveredInteractions = Computations.of(sample)
-                        .map(TWisePartialCountComputation::new)
-                        .set(TWisePartialCountComputation.T, t)
-                        .set(TWisePartialCountComputation.VARIABLE_FILTER, variableFilter)
-                        .set(
-                                TWisePartialCountComputation.COMBINATION_FILTER,
-                                TWisePartialCountComputation.CombinationList.of(
-                                        new ArrayList<>(interactionFilter.values())))
-                        .compute();
+                List<int[]> equalLiterals = equal
+                        ? atomicLiterals.stream().map(ABooleanAssignment::get).collect(Collectors.toList())
+                        : List.of();
+
+                boolean useIndex = optionParser.get(incrementalOption) && !equal;
+                if (useIndex && IncrementalCoverageIndex.estimateSize(t, n)
+                        > ((long) optionParser.get(incrementalIndexLimitOption) << 20)) {
+                    FeatJAR.log()
+                            .warning(
+                                    "Index of %s exceeds incremental_index_limit (t = %d, n = %d), counting completely",
+                                    getMetricKey(),
+                                    t,
+                                    n);
+                    useIndex = false;
+                }
+                if (useIndex) {
+                    coveredInteractions = computeIncremental(filteredVariables, interactionFilter.values());
+                } else {
+                    BooleanSolutionList countedSample = sample;
+                    if (optionParser.get(incrementalOption)) {
+                        // Partial samples are prefixes in incremental mode, as in computeIncremental
+                        List<BooleanSolution> reversedSample = new ArrayList<>(shuffledSample);
+                        Collections.reverse(reversedSample);
+                        countedSample = new BooleanSolutionList(reversedSample);
+                    }
+                    coveredInteractions = Computations.of(countedSample)
+                            .map(TWisePartialCountComputation::new)
+                            .set(TWisePartialCountComputation.T, t)
+                            .set(TWisePartialCountComputation.VARIABLE_FILTER, variableFilter)
+                            .set(
+                                    TWisePartialCountComputation.COMBINATION_FILTER,
+                                    TWisePartialCountComputation.CombinationList.of(
+                                            new ArrayList<>(interactionFilter.values())))
+                            .set(
+                                    TWisePartialCountComputation.EQUAL_LITERALS,
+                                    TWisePartialCountComputation.CombinationList.of(equalLiterals))
+                            .compute();
+                }
 
                 long end = System.nanoTime();
 
@@ -312,6 +365,7 @@ public class PartialCoveragePhase extends Evaluator {
                     w.add(n);
                     w.add(coverageID);
                     w.add(end - start);
+                    w.add(optionParser.get(incrementalOption));
                 });
 
                 long interactionSum = 0;
@@ -326,6 +380,7 @@ public class PartialCoveragePhase extends Evaluator {
                 }
                 try {
                     partialCoverageCSV.flush();
+                    Telemetry.add(Telemetry.ROWS_WRITTEN, coveredInteractions.length + 1);
                 } catch (Exception e) {
                     FeatJAR.log().error(e);
                 }
@@ -337,6 +392,35 @@ public class PartialCoveragePhase extends Evaluator {
         return -1;
     }
 
+    /**
+     * Computes the newly covered interactions per configuration with an {@link IncrementalCoverageIndex}.
+     * The index is reused if the sample only grew since the last run.
+     * In contrast to {@link TWisePartialCountComputation}, a partial sample consists of the first configurations of
+     * the sample. Thus, the statistic is returned in reverse order.
+     */
+    private long[] computeIncremental(int[] filteredVariables, Collection<int[]> filterCombinations) {
+        String metricKey = getMetricKey();
+        Path indexPath = modelPath.resolve(String.format("coverage_t%d_mi%d_%s.idx", t, modelIteration, metricKey));
+        IncrementalCoverageIndex index = IncrementalCoverageIndex.load(
+                        indexPath, t, filteredVariables, metricKey, filterCombinations)
+                .filter(i -> i.isPrefixOf(shuffledSample))
+                .orElseGet(() -> new IncrementalCoverageIndex(t, filteredVariables, metricKey, filterCombinations));
+        int oldSize = index.getConfigurationCount();
+        long[] statistic = index.extend(shuffledSample);
+        if (oldSize < statistic.length) {
+            try {
+                index.save(indexPath);
+            } catch (IOException e) {
+                FeatJAR.log().error(e);
+            }
+        }
+        long[] reversedStatistic = new long[statistic.length];
+        for (int i = 0; i < statistic.length; i++) {
+            reversedStatistic[statistic.length - 1 - i] = statistic[i];
+        }
+        return reversedStatistic;
+    }
+
     private String getMetricKey() {
         return String.format("%s_%s_%s_%s_%s_%s", core, dead, abstrakt, atomic, pc, equal);
     }
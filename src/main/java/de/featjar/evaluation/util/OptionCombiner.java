@@ -107,6 +107,7 @@ public class OptionCombiner {
                 }
             }
 
+            Telemetry.setPhaseProgress(progress.getTotalIndex() + 1, progress.getTotalSize(), printOptionValues());
             try {
                 lastErrorLevel = forEachOption.apply(progress.getLastChanged());
             } catch (Exception e) {
@@ -124,6 +125,20 @@ public class OptionCombiner {
                 : (T) optionParser.getResult(options[index]).orElseThrow().get(optionIndex);
     }
 
+    private String printOptionValues() {
+        StringBuilder valueMessage = new StringBuilder();
+        int[] sizes = progress.getSizes();
+        for (int i = 0; i < sizes.length; i++) {
+            if (sizes[i] > 1) {
+                valueMessage.append(options[i].getName());
+                valueMessage.append('=');
+                valueMessage.append(String.valueOf(getValue(i)));
+                valueMessage.append(' ');
+            }
+        }
+        return valueMessage.toString().trim();
+    }
+
     private String printOptionNames(AListOption<?>... loptions) {
         StringBuilder optionMessage = new StringBuilder();
         int[] sizes = progress.getSizes();
@@ -76,6 +76,14 @@ public class ProgressTracker implements Iterator<int[]> {
         return indices;
     }
 
+    public int getTotalIndex() {
+        return totalIndex;
+    }
+
+    public int getTotalSize() {
+        return totalSize;
+    }
+
     @Override
     public boolean hasNext() {
         return totalIndex < totalSize - 1;
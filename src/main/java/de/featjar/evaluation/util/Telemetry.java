@@ -0,0 +1,371 @@
+/*
+ * Copyright (C) 2024 FeatJAR-Development-Team
+ *
+ * This file is part of FeatJAR-evaluation.
+ *
+ * evaluation is free software: you can redistribute it and/or modify it
+ * under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3.0 of the License,
+ * or (at your option) any later version.
+ *
+ * evaluation is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+ * See the GNU Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with evaluation. If not, see <https://www.gnu.org/licenses/>.
+ *
+ * See <https://github.com/FeatureIDE/FeatJAR-evaluation> for further information.
+ */
+package de.featjar.evaluation.util;
+
+import com.sun.net.httpserver.HttpServer;
+import de.featjar.base.FeatJAR;
+import de.featjar.base.io.csv.CSVFile;
+import java.io.IOException;
+import java.io.OutputStream;
+import java.lang.management.ManagementFactory;
+import java.lang.management.ThreadMXBean;
+import java.net.InetAddress;
+import java.net.InetSocketAddress;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Path;
+import java.util.LinkedHashMap;
+import java.util.Map;
+import java.util.concurrent.ConcurrentHashMap;
+import java.util.concurrent.Executors;
+import java.util.concurrent.ScheduledExecutorService;
+import java.util.concurrent.TimeUnit;
+import java.util.concurrent.atomic.LongAdder;
+
+/**
+ * Collects counters of a running evaluation phase and periodically exports them.
+ * Every interval, a line is appended to telemetry.csv and the utilization of each worker thread is appended to
+ * telemetry_threads.csv. Optionally, the latest values are served in the Prometheus text format at
+ * http://localhost:&lt;port&gt;/metrics.
+ *
+ * @author anonymous
+ */
+public final class Telemetry {
+
+    public static final String COMBINATIONS = "combinations_enumerated";
+    public static final String COVERED_INTERACTIONS = "covered_interactions";
+    public static final String ROWS_WRITTEN = "rows_written";
+
+    private static final String WORKER_THREAD_PREFIX = "ForkJoinPool.commonPool-worker-";
+
+    /**
+     * Thread-confined counts of a parallel computation, which are added to the shared counters in batches.
+     */
+    public static final class Tally {
+        private static final long FLUSH_SIZE = 1 << 12;
+
+        private long combinations, coveredInteractions;
+
+        public void add(long combinations, long coveredInteractions) {
+            this.combinations += combinations;
+            this.coveredInteractions += coveredInteractions;
+            if (this.combinations >= FLUSH_SIZE) {
+                flush();
+            }
+        }
+
+        public void flush() {
+            counter(COMBINATIONS).add(combinations);
+            counter(COVERED_INTERACTIONS).add(coveredInteractions);
+            combinations = 0;
+            coveredInteractions = 0;
+        }
+    }
+
+    private static final Map<String, LongAdder> counters = new ConcurrentHashMap<>();
+
+    private static volatile String task = "";
+    private static volatile long taskStart, taskCombinationsStart, taskCombinations;
+    private static volatile int phaseStep, phaseSteps;
+    private static volatile String phaseLabel = "";
+
+    private static ScheduledExecutorService scheduler;
+    private static HttpServer server;
+    private static CSVFile phaseCSV, threadCSV;
+    private static long start, lastTime, lastCombinations;
+    private static Thread mainThread;
+    private static Map<Long, Long> lastThreadTimes = new LinkedHashMap<>();
+    private static volatile String metrics = "";
+
+    private Telemetry() {}
+
+    public static LongAdder counter(String name) {
+        return counters.computeIfAbsent(name, n -> new LongAdder());
+    }
+
+    public static void add(String name, long value) {
+        counter(name).add(value);
+    }
+
+    public static long get(String name) {
+        return counter(name).sum();
+    }
+
+    /**
+     * Sets the position of the current option combination of a phase.
+     *
+     * @param step the number of the current option combination, starting with 1
+     * @param steps the number of all option combinations
+     * @param label the option values of the current option combination
+     */
+    public static void setPhaseProgress(int step, int steps, String label) {
+        phaseStep = step;
+        phaseSteps = steps;
+        phaseLabel = label;
+    }
+
+    /**
+     * Starts a computation that enumerates the given number of combinations.
+     *
+     * @param name the name of the computation
+     * @param combinations the number of combinations the computation will enumerate
+     */
+    public static void startTask(String name, long combinations) {
+        taskCombinationsStart = get(COMBINATIONS);
+        taskCombinations = combinations;
+        taskStart = System.nanoTime();
+        task = name;
+    }
+
+    public static void endTask() {
+        task = "";
+        taskCombinations = 0;
+    }
+
+    /**
+     * Starts exporting all counters in the given interval.
+     *
+     * @param directory the directory of the metrics files
+     * @param intervalSeconds the time between two exports
+     * @param port the local port of the HTTP endpoint or a negative value to not start an endpoint
+     * @throws IOException if a metrics file or the endpoint cannot be created
+     */
+    public static void start(Path directory, long intervalSeconds, int port) throws IOException {
+        stop();
+        phaseCSV = new CSVFile(directory.resolve("telemetry.csv"));
+        phaseCSV.setHeaderFields(
+                "Time",
+                "PhaseStep",
+                "PhaseSteps",
+                "Options",
+                "Task",
+                "CombinationsEnumerated",
+                "CombinationsPerSecond",
+                "CoveredInteractions",
+                "RowsWritten",
+                "HeapUsed",
+                "HeapMax",
+                "TaskProgress",
+                "TaskEta",
+                "PhaseEta",
+                "MinThreadUtilization",
+                "MaxThreadUtilization");
+        phaseCSV.flush();
+        threadCSV = new CSVFile(directory.resolve("telemetry_threads.csv"));
+        threadCSV.setHeaderFields("Time", "Thread", "Utilization");
+        threadCSV.flush();
+
+        mainThread = Thread.currentThread();
+        start = System.nanoTime();
+        lastTime = start;
+        lastCombinations = get(COMBINATIONS);
+        lastThreadTimes.clear();
+
+        if (port >= 0) {
+            server = HttpServer.create(new InetSocketAddress(InetAddress.getLoopbackAddress(), port), 0);
+            server.createContext("/metrics", exchange -> {
+                byte[] response = metrics.getBytes(StandardCharsets.UTF_8);
+                exchange.getResponseHeaders().set("Content-Type", "text/plain; version=0.0.4");
+                exchange.sendResponseHeaders(200, response.length);
+                try (OutputStream body = exchange.getResponseBody()) {
+                    body.write(response);
+                }
+            });
+            server.start();
+            FeatJAR.log().info("Serving telemetry at http://localhost:%d/metrics", server.getAddress().getPort());
+        }
+
+        scheduler = Executors.newSingleThreadScheduledExecutor(r -> {
+            Thread thread = new Thread(r, "telemetry");
+            thread.setDaemon(true);
+            return thread;
+        });
+        scheduler.scheduleAtFixedRate(Telemetry::export, intervalSeconds, intervalSeconds, TimeUnit.SECONDS);
+    }
+
+    /**
+     * {@return the local port of the HTTP endpoint, or -1 if no endpoint is running}
+     */
+    public static int getPort() {
+        return server == null ? -1 : server.getAddress().getPort();
+    }
+
+    /**
+     * Exports the counters one last time, stops exporting, and closes the metrics files.
+     * Also releases whatever a failed {@link #start(Path, long, int)} already created.
+     */
+    public static void stop() {
+        if (scheduler != null) {
+            scheduler.shutdownNow();
+            try {
+                scheduler.awaitTermination(1, TimeUnit.MINUTES);
+            } catch (InterruptedException e) {
+                Thread.currentThread().interrupt();
+            }
+            scheduler = null;
+            export();
+        }
+        if (server != null) {
+            server.stop(0);
+            server = null;
+        }
+        phaseCSV = close(phaseCSV);
+        threadCSV = close(threadCSV);
+    }
+
+    private static CSVFile close(CSVFile csv) {
+        if (csv != null) {
+            try {
+                csv.close();
+            } catch (IOException e) {
+                FeatJAR.log().error(e);
+            }
+        }
+        return null;
+    }
+
+    private static synchronized void export() {
+        try {
+            long now = System.nanoTime();
+            double time = (now - start) / 1e9;
+            double interval = Math.max(now - lastTime, 1) / 1e9;
+            lastTime = now;
+
+            long combinations = get(COMBINATIONS);
+            double combinationsPerSecond = (combinations - lastCombinations) / interval;
+            lastCombinations = combinations;
+
+            Runtime runtime = Runtime.getRuntime();
+            long heapUsed = runtime.totalMemory() - runtime.freeMemory();
+            long heapMax = runtime.maxMemory();
+
+            String currentTask = task;
+            long total = taskCombinations;
+            double taskProgress = -1, taskEta = -1;
+            if (!currentTask.isEmpty() && total > 0) {
+                long done = combinations - taskCombinationsStart;
+                taskProgress = Math.min((double) done / total, 1);
+                if (done > 0) {
+                    taskEta = (total - done) * ((now - taskStart) / 1e9) / done;
+                }
+                if (combinationsPerSecond == 0) {
+                    FeatJAR.log()
+                            .warning("No combinations enumerated during the last %.0f s of %s", interval, currentTask);
+                }
+            }
+            int step = phaseStep;
+            int steps = phaseSteps;
+            double phaseEta = -1;
+            if (steps > 0 && step > 0) {
+                double phaseProgress = (step - 1 + Math.max(taskProgress, 0)) / steps;
+                if (phaseProgress > 0) {
+                    phaseEta = time * (1 - phaseProgress) / phaseProgress;
+                }
+            }
+
+            Map<String, Double> utilization = getThreadUtilization(interval);
+            double minUtilization = utilization.values().stream()
+                    .mapToDouble(Double::doubleValue)
+                    .min()
+                    .orElse(-1);
+            double maxUtilization = utilization.values().stream()
+                    .mapToDouble(Double::doubleValue)
+                    .max()
+                    .orElse(-1);
+
+            phaseCSV.newLine();
+            phaseCSV.add(time);
+            phaseCSV.add(String.valueOf(step));
+            phaseCSV.add(String.valueOf(steps));
+            phaseCSV.add(phaseLabel);
+            phaseCSV.add(currentTask);
+            phaseCSV.add(String.valueOf(combinations));
+            phaseCSV.add(combinationsPerSecond);
+            phaseCSV.add(String.valueOf(get(COVERED_INTERACTIONS)));
+            phaseCSV.add(String.valueOf(get(ROWS_WRITTEN)));
+            phaseCSV.add(String.valueOf(heapUsed));
+            phaseCSV.add(String.valueOf(heapMax));
+            phaseCSV.add(taskProgress);
+            phaseCSV.add(taskEta);
+            phaseCSV.add(phaseEta);
+            phaseCSV.add(minUtilization);
+            phaseCSV.add(maxUtilization);
+            phaseCSV.flush();
+            for (Map.Entry<String, Double> entry : utilization.entrySet()) {
+                threadCSV.newLine();
+                threadCSV.add(time);
+                threadCSV.add(entry.getKey());
+                threadCSV.add(entry.getValue());
+            }
+            threadCSV.flush();
+
+            StringBuilder sb = new StringBuilder();
+            appendMetric(sb, "phase_step", "", step);
+            appendMetric(sb, "phase_steps", "", steps);
+            appendMetric(sb, "phase_eta_seconds", "", phaseEta);
+            appendMetric(sb, "task_progress", "", taskProgress);
+            appendMetric(sb, "task_eta_seconds", "", taskEta);
+            for (Map.Entry<String, LongAdder> entry : counters.entrySet()) {
+                appendMetric(sb, entry.getKey() + "_total", "", entry.getValue().sum());
+            }
+            appendMetric(sb, "combinations_per_second", "", combinationsPerSecond);
+            appendMetric(sb, "heap_used_bytes", "", heapUsed);
+            appendMetric(sb, "heap_max_bytes", "", heapMax);
+            for (Map.Entry<String, Double> entry : utilization.entrySet()) {
+                appendMetric(sb, "thread_utilization", "{thread=\"" + entry.getKey() + "\"}", entry.getValue());
+            }
+            metrics = sb.toString();
+        } catch (Exception e) {
+            FeatJAR.log().error(e);
+        }
+    }
+
+    private static Map<String, Double> getThreadUtilization(double interval) {
+        ThreadMXBean threadBean = ManagementFactory.getThreadMXBean();
+        Map<String, Double> utilization = new LinkedHashMap<>();
+        if (!threadBean.isThreadCpuTimeSupported()) {
+            return utilization;
+        }
+        Map<Long, Long> threadTimes = new LinkedHashMap<>();
+        for (Thread thread : Thread.getAllStackTraces().keySet()) {
+            if (thread == mainThread || thread.getName().startsWith(WORKER_THREAD_PREFIX)) {
+                long cpuTime = threadBean.getThreadCpuTime(thread.getId());
+                if (cpuTime >= 0) {
+                    threadTimes.put(thread.getId(), cpuTime);
+                    Long lastCpuTime = lastThreadTimes.get(thread.getId());
+                    if (lastCpuTime != null) {
+                        utilization.put(thread.getName(), Math.min((cpuTime - lastCpuTime) / 1e9 / interval, 1));
+                    }
+                }
+            }
+        }
+        lastThreadTimes = threadTimes;
+        return utilization;
+    }
+
+    private static void appendMetric(StringBuilder sb, String name, String labels, Number value) {
+        sb.append("featjar_");
+        sb.append(name);
+        sb.append(labels);
+        sb.append(' ');
+        sb.append(value);
+        sb.append('\n');
+    }
+}
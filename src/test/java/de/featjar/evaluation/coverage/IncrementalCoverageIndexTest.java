@@ -0,0 +1,121 @@
+/*
+ * Copyright (C) 2024 FeatJAR-Development-Team
+ *
+ * This file is part of FeatJAR-evaluation-coverage-metrics.
+ *
+ * evaluation-coverage-metrics is free software: you can redistribute it and/or modify it
+ * under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3.0 of the License,
+ * or (at your option) any later version.
+ *
+ * evaluation-coverage-metrics is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+ * See the GNU Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with evaluation-coverage-metrics. If not, see <https://www.gnu.org/licenses/>.
+ *
+ * See <https://github.com/FeatJAR> for further information.
+ */
+package de.featjar.evaluation.coverage;
+
+import static org.junit.jupiter.api.Assertions.assertArrayEquals;
+import static org.junit.jupiter.api.Assertions.assertFalse;
+import static org.junit.jupiter.api.Assertions.assertTrue;
+
+import de.featjar.base.computation.Computations;
+import de.featjar.formula.assignment.BooleanSolution;
+import de.featjar.formula.assignment.BooleanSolutionList;
+import java.io.IOException;
+import java.nio.file.Path;
+import java.util.ArrayList;
+import java.util.Collections;
+import java.util.List;
+import java.util.Random;
+import java.util.stream.IntStream;
+import org.junit.jupiter.api.Test;
+import org.junit.jupiter.api.io.TempDir;
+
+/**
+ * Checks that extending an {@link IncrementalCoverageIndex} gives the same result as counting the whole sample at once,
+ * both with a new index and with {@link TWisePartialCountComputation}.
+ *
+ * @author anonymous
+ */
+public class IncrementalCoverageIndexTest {
+
+    private static final int N = 10;
+    private static final int T = 3;
+    private static final String METRIC_KEY = "test";
+    private static final int[] LITERALS = IntStream.rangeClosed(1, N).toArray();
+    private static final List<int[]> FILTER =
+            List.of(new int[] {1, 2, 3}, new int[] {-4, 5, -6}, new int[] {3, 2, 1}, new int[] {-7, 8, -9});
+
+    @TempDir
+    Path directory;
+
+    @Test
+    public void extendEqualsFullCount() throws IOException {
+        List<BooleanSolution> sample = createSample(12);
+
+        IncrementalCoverageIndex index = new IncrementalCoverageIndex(T, LITERALS, METRIC_KEY, FILTER);
+        index.extend(sample.subList(0, 5));
+        Path path = directory.resolve("coverage.idx");
+        index.save(path);
+
+        IncrementalCoverageIndex loadedIndex = IncrementalCoverageIndex.load(path, T, LITERALS, METRIC_KEY, FILTER)
+                .orElseThrow();
+        assertTrue(loadedIndex.isPrefixOf(sample));
+        long[] extendedStatistic = loadedIndex.extend(sample);
+
+        long[] fullStatistic = new IncrementalCoverageIndex(T, LITERALS, METRIC_KEY, FILTER).extend(sample);
+        assertArrayEquals(fullStatistic, extendedStatistic);
+
+        // TWisePartialCountComputation counts each interaction at its last covering configuration
+        List<BooleanSolution> reversedSample = new ArrayList<>(sample);
+        Collections.reverse(reversedSample);
+        long[] recount = Computations.of(new BooleanSolutionList(reversedSample))
+                .map(TWisePartialCountComputation::new)
+                .set(TWisePartialCountComputation.T, T)
+                .set(
+                        TWisePartialCountComputation.COMBINATION_FILTER,
+                        TWisePartialCountComputation.CombinationList.of(FILTER))
+                .compute();
+        long[] reversedRecount = new long[recount.length];
+        for (int i = 0; i < recount.length; i++) {
+            reversedRecount[recount.length - 1 - i] = recount[i];
+        }
+        assertArrayEquals(reversedRecount, extendedStatistic);
+    }
+
+    @Test
+    public void rejectsOtherSamplesAndMetrics() throws IOException {
+        List<BooleanSolution> sample = createSample(6);
+        IncrementalCoverageIndex index = new IncrementalCoverageIndex(T, LITERALS, METRIC_KEY, FILTER);
+        index.extend(sample);
+        Path path = directory.resolve("coverage.idx");
+        index.save(path);
+
+        List<BooleanSolution> otherSample = new ArrayList<>(sample);
+        Collections.swap(otherSample, 0, 1);
+        assertFalse(index.isPrefixOf(otherSample));
+        assertTrue(IncrementalCoverageIndex.load(path, T, LITERALS, METRIC_KEY, FILTER).isPresent());
+        assertFalse(IncrementalCoverageIndex.load(path, T, LITERALS, "other", FILTER).isPresent());
+        assertFalse(IncrementalCoverageIndex.load(path, T, LITERALS, METRIC_KEY, List.of()).isPresent());
+        assertFalse(IncrementalCoverageIndex.load(path, T - 1, LITERALS, METRIC_KEY, FILTER).isPresent());
+    }
+
+    private static List<BooleanSolution> createSample(int size) {
+        Random random = new Random(1);
+        List<BooleanSolution> sample = new ArrayList<>(size);
+        for (int i = 0; i < size; i++) {
+            int[] literals = new int[N];
+            for (int j = 0; j < N; j++) {
+                literals[j] = random.nextBoolean() ? j + 1 : -(j + 1);
+            }
+            sample.add(new BooleanSolution(literals, false));
+        }
+        return sample;
+    }
+}
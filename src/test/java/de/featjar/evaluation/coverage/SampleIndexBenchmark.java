@@ -0,0 +1,153 @@
+/*
+ * Copyright (C) 2024 FeatJAR-Development-Team
+ *
+ * This file is part of FeatJAR-evaluation-coverage-metrics.
+ *
+ * evaluation-coverage-metrics is free software: you can redistribute it and/or modify it
+ * under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3.0 of the License,
+ * or (at your option) any later version.
+ *
+ * evaluation-coverage-metrics is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+ * See the GNU Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with evaluation-coverage-metrics. If not, see <https://www.gnu.org/licenses/>.
+ *
+ * See <https://github.com/FeatJAR> for further information.
+ */
+package de.featjar.evaluation.coverage;
+
+import de.featjar.analysis.sat4j.twise.BlockedSampleBitIndex;
+import de.featjar.analysis.sat4j.twise.SampleBitIndex;
+import de.featjar.base.data.Ints;
+import de.featjar.base.data.LexicographicIterator;
+import de.featjar.base.io.IO;
+import de.featjar.formula.assignment.ABooleanAssignment;
+import de.featjar.formula.assignment.BooleanSolution;
+import de.featjar.formula.io.csv.BooleanSolutionListCSVFormat;
+import java.lang.management.GarbageCollectorMXBean;
+import java.lang.management.ManagementFactory;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.List;
+import java.util.Random;
+import java.util.concurrent.atomic.LongAdder;
+import java.util.function.ToIntFunction;
+import java.util.stream.Collectors;
+import java.util.stream.IntStream;
+
+/**
+ * Compares the throughput and garbage collection of {@link SampleBitIndex} and {@link BlockedSampleBitIndex} on the
+ * coverage loop of {@link TWisePartialCountComputation}.
+ * Arguments (all optional): number of variables, sample size, t, repetitions, which benchmark a random sample.
+ * Alternatively, the first argument is a sample file written by the sample phase (e.g.,
+ * results/&lt;time-stamp&gt;/gen/&lt;system&gt;/sample_t3_mi1.csv), followed by t and repetitions.
+ *
+ * @author anonymous
+ */
+public class SampleIndexBenchmark {
+
+    public static void main(String[] args) {
+        if (args.length > 0 && Files.isRegularFile(Path.of(args[0]))) {
+            List<BooleanSolution> sample = IO.load(Path.of(args[0]), new BooleanSolutionListCSVFormat())
+                    .orElseThrow()
+                    .getFirstGroup()
+                    .stream()
+                    .map(ABooleanAssignment::toSolution)
+                    .collect(Collectors.toList());
+            int t = args.length > 1 ? Integer.parseInt(args[1]) : 2;
+            int repetitions = args.length > 2 ? Integer.parseInt(args[2]) : 5;
+            benchmark(sample, sample.get(0).size(), t, repetitions);
+        } else {
+            int n = args.length > 0 ? Integer.parseInt(args[0]) : 200;
+            int sampleSize = args.length > 1 ? Integer.parseInt(args[1]) : 500;
+            int t = args.length > 2 ? Integer.parseInt(args[2]) : 2;
+            int repetitions = args.length > 3 ? Integer.parseInt(args[3]) : 5;
+
+            Random random = new Random(1);
+            List<BooleanSolution> sample = new ArrayList<>(sampleSize);
+            for (int i = 0; i < sampleSize; i++) {
+                int[] literals = new int[n];
+                for (int j = 0; j < n; j++) {
+                    literals[j] = random.nextBoolean() ? j + 1 : -(j + 1);
+                }
+                sample.add(new BooleanSolution(literals, false));
+            }
+            benchmark(sample, n, t, repetitions);
+        }
+    }
+
+    private static void benchmark(List<BooleanSolution> sample, int n, int t, int repetitions) {
+        System.out.printf("n = %d, sample size = %d, t = %d%n", n, sample.size(), t);
+
+        SampleBitIndex bitSetIndex = new SampleBitIndex(sample, n);
+        BlockedSampleBitIndex blockedIndex = new BlockedSampleBitIndex(sample, n);
+        for (int i = 0; i < repetitions; i++) {
+            long a = run("SampleBitIndex", n, t, bitSetIndex::index);
+            long b = run("BlockedSampleBitIndex", n, t, blockedIndex::index);
+            if (a != b) {
+                throw new IllegalStateException(String.format("Checksums differ: %d != %d", a, b));
+            }
+        }
+    }
+
+    private static long run(String name, int n, int t, ToIntFunction<int[]> index) {
+        final int[] literals = IntStream.rangeClosed(1, n).toArray();
+        final int[] gray = Ints.grayCode(t);
+        LongAdder checks = new LongAdder();
+        LongAdder checksum = new LongAdder();
+
+        long gcCount = gcCount();
+        long gcTime = gcTime();
+        long allocatedBytes = allocatedBytes();
+        long start = System.nanoTime();
+        LexicographicIterator.parallelStream(t, literals.length).forEach(combo -> {
+            int[] select = combo.getSelection(literals);
+            long sum = 0;
+            for (int g : gray) {
+                sum += index.applyAsInt(select);
+                select[g] = -select[g];
+            }
+            checks.add(gray.length);
+            checksum.add(sum);
+        });
+        long time = System.nanoTime() - start;
+
+        System.out.printf(
+                "%-22s %10.2f M interactions/s, %10.1f MiB allocated, %5d collections, %6d ms in GC%n",
+                name,
+                checks.sum() / (time / 1_000.0),
+                (allocatedBytes() - allocatedBytes) / (1024.0 * 1024.0),
+                gcCount() - gcCount,
+                gcTime() - gcTime);
+        return checksum.sum();
+    }
+
+    /**
+     * {@return the bytes allocated by all live threads so far}
+     * Common pool workers that terminate during a run are not counted.
+     */
+    private static long allocatedBytes() {
+        com.sun.management.ThreadMXBean threads = (com.sun.management.ThreadMXBean) ManagementFactory.getThreadMXBean();
+        return Arrays.stream(threads.getThreadAllocatedBytes(threads.getAllThreadIds()))
+                .filter(bytes -> bytes > 0)
+                .sum();
+    }
+
+    private static long gcCount() {
+        return ManagementFactory.getGarbageCollectorMXBeans().stream()
+                .mapToLong(GarbageCollectorMXBean::getCollectionCount)
+                .sum();
+    }
+
+    private static long gcTime() {
+        return ManagementFactory.getGarbageCollectorMXBeans().stream()
+                .mapToLong(GarbageCollectorMXBean::getCollectionTime)
+                .sum();
+    }
+}
@@ -0,0 +1,163 @@
+/*
+ * Copyright (C) 2024 FeatJAR-Development-Team
+ *
+ * This file is part of FeatJAR-evaluation-coverage-metrics.
+ *
+ * evaluation-coverage-metrics is free software: you can redistribute it and/or modify it
+ * under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3.0 of the License,
+ * or (at your option) any later version.
+ *
+ * evaluation-coverage-metrics is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+ * See the GNU Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with evaluation-coverage-metrics. If not, see <https://www.gnu.org/licenses/>.
+ *
+ * See <https://github.com/FeatJAR> for further information.
+ */
+package de.featjar.evaluation.coverage;
+
+import static org.junit.jupiter.api.Assertions.assertArrayEquals;
+
+import de.featjar.base.computation.Computations;
+import de.featjar.base.data.LexicographicIterator;
+import de.featjar.formula.assignment.BooleanSolution;
+import de.featjar.formula.assignment.BooleanSolutionList;
+import java.util.HashMap;
+import java.util.HashSet;
+import java.util.List;
+import java.util.Map;
+import java.util.Set;
+import java.util.stream.Collectors;
+import java.util.stream.IntStream;
+import org.junit.jupiter.api.Test;
+
+/**
+ * Compares {@link TWisePartialCountComputation} with a brute-force count on a small CNF, whose only constraints are
+ * the atomic sets {1, 2, 6} and {3, -4}.
+ * With filtered equal interactions, two interactions are the same if they are covered by the same valid
+ * configurations.
+ *
+ * @author anonymous
+ */
+public class TWisePartialCountComputationTest {
+
+    private static final int N = 6;
+    private static final int[][] CNF = {{-1, 2}, {1, -2}, {-2, 6}, {2, -6}, {3, 4}, {-3, -4}};
+    private static final List<int[]> ATOMIC_SETS = List.of(new int[] {1, 2, 6}, new int[] {3, -4}, new int[] {5});
+
+    private static final List<BooleanSolution> SOLUTIONS = IntStream.range(0, 1 << N)
+            .mapToObj(bits -> IntStream.rangeClosed(1, N)
+                    .map(v -> (bits & (1 << (v - 1))) != 0 ? v : -v)
+                    .toArray())
+            .filter(TWisePartialCountComputationTest::isValid)
+            .map(literals -> new BooleanSolution(literals, false))
+            .collect(Collectors.toList());
+
+    private static final List<BooleanSolution> SAMPLE =
+            List.of(SOLUTIONS.get(5), SOLUTIONS.get(0), SOLUTIONS.get(3), SOLUTIONS.get(6), SOLUTIONS.get(3));
+
+    @Test
+    public void countsEveryInteraction() {
+        for (int t = 1; t <= 3; t++) {
+            assertArrayEquals(bruteForce(t, false, List.of()), compute(t, List.of(), List.of()));
+        }
+    }
+
+    @Test
+    public void countsEqualInteractionsOnce() {
+        for (int t = 1; t <= 3; t++) {
+            assertArrayEquals(bruteForce(t, true, List.of()), compute(t, ATOMIC_SETS, List.of()));
+        }
+    }
+
+    @Test
+    public void subtractsEqualFilteredInteractionsOnce() {
+        List<int[]> filter2 = List.of(new int[] {1, -3}, new int[] {2, 4}, new int[] {6, -3}, new int[] {5, -6});
+        assertArrayEquals(bruteForce(2, true, filter2), compute(2, ATOMIC_SETS, filter2));
+        List<int[]> filter3 = List.of(new int[] {1, 2, -3}, new int[] {1, -3, 5}, new int[] {2, 4, 5});
+        assertArrayEquals(bruteForce(3, true, filter3), compute(3, ATOMIC_SETS, filter3));
+    }
+
+    private static long[] compute(int t, List<int[]> atomicSets, List<int[]> filter) {
+        return Computations.of(new BooleanSolutionList(SAMPLE))
+                .map(TWisePartialCountComputation::new)
+                .set(TWisePartialCountComputation.T, t)
+                .set(
+                        TWisePartialCountComputation.COMBINATION_FILTER,
+                        TWisePartialCountComputation.CombinationList.of(filter))
+                .set(
+                        TWisePartialCountComputation.EQUAL_LITERALS,
+                        TWisePartialCountComputation.CombinationList.of(atomicSets))
+                .compute();
+    }
+
+    /**
+     * Counts each interaction (or each class of equal interactions) at the last configuration of the sample that
+     * covers it.
+     */
+    private static long[] bruteForce(int t, boolean equal, List<int[]> filter) {
+        Set<Object> filteredKeys = filter.stream().map(i -> key(i, equal)).collect(Collectors.toSet());
+        Map<Object, Integer> lastIndices = new HashMap<>();
+        LexicographicIterator.stream(t, N).forEach(combo -> {
+            int[] variables = combo.getSelection(IntStream.rangeClosed(1, N).toArray());
+            for (int pattern = 0; pattern < 1 << t; pattern++) {
+                int[] interaction = new int[t];
+                for (int j = 0; j < t; j++) {
+                    interaction[j] = (pattern & (1 << j)) != 0 ? variables[j] : -variables[j];
+                }
+                Object key = key(interaction, equal);
+                int last = -1;
+                for (int i = 0; i < SAMPLE.size(); i++) {
+                    if (covers(SAMPLE.get(i).get(), interaction)) {
+                        last = i;
+                    }
+                }
+                if (last >= 0 && !filteredKeys.contains(key)) {
+                    lastIndices.put(key, last);
+                }
+            }
+        });
+        long[] statistic = new long[SAMPLE.size()];
+        lastIndices.values().forEach(i -> statistic[i]++);
+        return statistic;
+    }
+
+    private static Object key(int[] interaction, boolean equal) {
+        if (!equal) {
+            return IntStream.of(interaction).boxed().collect(Collectors.toSet());
+        }
+        Set<Integer> coveringSolutions = new HashSet<>();
+        for (int i = 0; i < SOLUTIONS.size(); i++) {
+            if (covers(SOLUTIONS.get(i).get(), interaction)) {
+                coveringSolutions.add(i);
+            }
+        }
+        return coveringSolutions;
+    }
+
+    private static boolean covers(int[] configuration, int[] interaction) {
+        for (int literal : interaction) {
+            if (configuration[Math.abs(literal) - 1] != literal) {
+                return false;
+            }
+        }
+        return true;
+    }
+
+    private static boolean isValid(int[] configuration) {
+        for (int[] clause : CNF) {
+            boolean satisfied = false;
+            for (int literal : clause) {
+                satisfied |= configuration[Math.abs(literal) - 1] == literal;
+            }
+            if (!satisfied) {
+                return false;
+            }
+        }
+        return true;
+    }
+}
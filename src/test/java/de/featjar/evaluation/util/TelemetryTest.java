@@ -0,0 +1,137 @@
+/*
+ * Copyright (C) 2024 FeatJAR-Development-Team
+ *
+ * This file is part of FeatJAR-evaluation-coverage-metrics.
+ *
+ * evaluation-coverage-metrics is free software: you can redistribute it and/or modify it
+ * under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3.0 of the License,
+ * or (at your option) any later version.
+ *
+ * evaluation-coverage-metrics is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+ * See the GNU Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with evaluation-coverage-metrics. If not, see <https://www.gnu.org/licenses/>.
+ *
+ * See <https://github.com/FeatJAR> for further information.
+ */
+package de.featjar.evaluation.util;
+
+import static org.junit.jupiter.api.Assertions.assertEquals;
+import static org.junit.jupiter.api.Assertions.assertThrows;
+import static org.junit.jupiter.api.Assertions.assertTrue;
+
+import java.io.IOException;
+import java.io.InputStream;
+import java.net.InetAddress;
+import java.net.InetSocketAddress;
+import java.net.ServerSocket;
+import java.net.URL;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.util.List;
+import org.junit.jupiter.api.AfterEach;
+import org.junit.jupiter.api.Test;
+import org.junit.jupiter.api.io.TempDir;
+
+/**
+ * Checks the batched counting of {@link Telemetry.Tally} and the export of the counters to telemetry.csv and the
+ * HTTP endpoint.
+ *
+ * @author anonymous
+ */
+public class TelemetryTest {
+
+    @TempDir
+    Path directory;
+
+    @AfterEach
+    public void stop() {
+        Telemetry.endTask();
+        Telemetry.stop();
+    }
+
+    @Test
+    public void tallyFlushesInBatches() {
+        long combinations = Telemetry.get(Telemetry.COMBINATIONS);
+        long coveredInteractions = Telemetry.get(Telemetry.COVERED_INTERACTIONS);
+        Telemetry.Tally tally = new Telemetry.Tally();
+        for (int i = 1; i < 4096; i++) {
+            tally.add(1, 2);
+        }
+        assertEquals(combinations, Telemetry.get(Telemetry.COMBINATIONS));
+        tally.add(1, 2);
+        assertEquals(combinations + 4096, Telemetry.get(Telemetry.COMBINATIONS));
+        assertEquals(coveredInteractions + 8192, Telemetry.get(Telemetry.COVERED_INTERACTIONS));
+        tally.add(1, 0);
+        tally.flush();
+        assertEquals(combinations + 4097, Telemetry.get(Telemetry.COMBINATIONS));
+    }
+
+    @Test
+    public void exportsCountersToCsvAndEndpoint() throws Exception {
+        Telemetry.start(directory, 1, 0);
+        Telemetry.setPhaseProgress(1, 2, "t=2");
+        Telemetry.startTask("test", 2 * 4096);
+        Telemetry.Tally tally = new Telemetry.Tally();
+        for (int i = 0; i < 4096; i++) {
+            tally.add(1, 1);
+        }
+        Telemetry.add(Telemetry.ROWS_WRITTEN, 3);
+        long combinations = Telemetry.get(Telemetry.COMBINATIONS);
+        long rows = Telemetry.get(Telemetry.ROWS_WRITTEN);
+
+        String expectedLine = "featjar_rows_written_total " + rows + "\n";
+        String metrics = "";
+        for (int i = 0; i < 100 && !metrics.contains(expectedLine); i++) {
+            Thread.sleep(100);
+            metrics = fetchMetrics(Telemetry.getPort());
+        }
+        assertTrue(metrics.contains(expectedLine), metrics);
+        assertTrue(metrics.contains("featjar_combinations_enumerated_total " + combinations + "\n"), metrics);
+        assertTrue(metrics.contains("featjar_task_progress 0.5\n"), metrics);
+
+        Telemetry.stop();
+        List<String> lines = Files.readAllLines(directory.resolve("telemetry.csv"));
+        assertTrue(lines.size() >= 2);
+        assertTrue(lines.get(0).startsWith("Time,PhaseStep,PhaseSteps,Options,Task,CombinationsEnumerated,"));
+        String[] lastLine = lines.get(lines.size() - 1).split(",");
+        assertEquals("1", lastLine[1]);
+        assertEquals("2", lastLine[2]);
+        assertEquals("t=2", lastLine[3]);
+        assertEquals("test", lastLine[4]);
+        assertEquals(String.valueOf(combinations), lastLine[5]);
+        assertEquals(String.valueOf(rows), lastLine[8]);
+        assertEquals(0.5, Double.parseDouble(lastLine[11]), 1e-9);
+        assertEquals(
+                "Time,Thread,Utilization",
+                Files.readAllLines(directory.resolve("telemetry_threads.csv")).get(0));
+    }
+
+    @Test
+    public void failedStartCanBeStoppedAndRestarted() throws Exception {
+        try (ServerSocket socket = new ServerSocket()) {
+            socket.bind(new InetSocketAddress(InetAddress.getLoopbackAddress(), 0));
+            assertThrows(IOException.class, () -> Telemetry.start(directory, 1, socket.getLocalPort()));
+        }
+        Telemetry.stop();
+        assertEquals(-1, Telemetry.getPort());
+
+        Telemetry.start(directory, 1, -1);
+        Telemetry.stop();
+        List<String> lines = Files.readAllLines(directory.resolve("telemetry.csv"));
+        assertTrue(lines.get(0).startsWith("Time,PhaseStep,PhaseSteps,"));
+        assertEquals(2, lines.size());
+    }
+
+    private static String fetchMetrics(int port) throws IOException {
+        URL url = new URL("http", InetAddress.getLoopbackAddress().getHostAddress(), port, "/metrics");
+        try (InputStream in = url.openStream()) {
+            return new String(in.readAllBytes(), StandardCharsets.UTF_8);
+        }
+    }
+}
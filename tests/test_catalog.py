@@ -0,0 +1,53 @@
+import pandas as pd
+import pytest
+
+from evalresults.catalog import Catalog
+
+FIRST = '2024-01-01_00-00-00'
+SECOND = '2024-01-02_00-00-00'
+UNPREPARED = '2024-01-03_00-00-00'
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    for name, coverage in ((FIRST, [0.5, 0.7, 1.0]), (SECOND, [0.6, 0.8, 1.0])):
+        plot_dir = tmp_path / name / 'plot'
+        plot_dir.mkdir(parents=True)
+        pd.DataFrame({
+            'SystemName': ['a', 'a', 'b'],
+            'T': [2, 2, 2],
+            'Metric': ['default', 'default', 'default'],
+            'Coverage': coverage,
+        }).to_pickle(plot_dir / 'complete.pkl', compression='gzip')
+    (tmp_path / UNPREPARED / 'data').mkdir(parents=True)
+    (tmp_path / 'not-a-run').mkdir()
+    return Catalog(str(tmp_path))
+
+
+def test_run_names_only_match_timestamps(catalog):
+    assert catalog.run_names == [FIRST, SECOND, UNPREPARED]
+
+
+def test_table_stacks_runs_and_skips_unprepared(catalog, capsys):
+    df = catalog.table('complete', where=lambda df: df['SystemName'] == 'a', columns=['SystemName', 'Coverage'])
+    assert 'Skipping run(s) without complete.pkl: ' + UNPREPARED in capsys.readouterr().out
+    assert list(df.columns) == ['SystemName', 'Coverage', 'Run']
+    assert df['Run'].tolist() == [FIRST, FIRST, SECOND, SECOND]
+    assert df['Coverage'].tolist() == [0.5, 0.7, 0.6, 0.8]
+
+
+def test_table_raises_for_given_unprepared_run(catalog):
+    with pytest.raises(FileNotFoundError, match=UNPREPARED):
+        catalog.table('complete', runs=[FIRST, UNPREPARED])
+
+
+def test_table_raises_without_any_prepared_run(catalog):
+    with pytest.raises(FileNotFoundError, match='No run in'):
+        catalog.table('systems')
+
+
+def test_compare_aligns_runs_on_key(catalog):
+    df = catalog.compare('Coverage', ['SystemName', 'T'], [SECOND, FIRST])
+    assert list(df.columns) == [SECOND, FIRST]
+    assert df.loc[('a', 2)].tolist() == pytest.approx([0.7, 0.6])
+    assert df.loc[('b', 2)].tolist() == [1.0, 1.0]
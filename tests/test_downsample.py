@@ -0,0 +1,29 @@
+import numpy as np
+
+from evalresults.downsample import lttb
+
+
+def test_lttb_keeps_endpoints_within_budget():
+    x = np.linspace(0, 1, 1000)
+    y = np.sin(x * 20)
+    for budget in (3, 4, 10, 999):
+        selected = lttb(x, y, budget)
+        assert len(selected) <= budget
+        assert selected[0] == 0
+        assert selected[-1] == len(x) - 1
+        assert np.all(np.diff(selected) > 0)
+
+
+def test_lttb_keeps_short_lines():
+    x = np.arange(5)
+    y = x ** 2
+    np.testing.assert_array_equal(lttb(x, y, 5), np.arange(5))
+    np.testing.assert_array_equal(lttb(x, y, 10), np.arange(5))
+    np.testing.assert_array_equal(lttb(x[:1], y[:1], 3), np.arange(1))
+
+
+def test_lttb_keeps_peak():
+    x = np.arange(101)
+    y = np.zeros(101)
+    y[37] = 1
+    assert 37 in lttb(x, y, 10)
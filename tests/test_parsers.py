@@ -0,0 +1,73 @@
+import os
+
+import numpy as np
+import pytest
+
+from evalresults.parsers import read_dimacs, read_group, read_properties, read_sample
+
+SYSTEM_DIR = os.path.join(os.path.dirname(__file__), 'fixtures', 'run', 'gen', 'sys')
+PROPERTIES_FILE = os.path.join(os.path.dirname(__file__), 'fixtures', 'run', 'data', 'data-2024-01-01_00-00-00',
+                               'config.properties')
+
+
+def test_read_dimacs_builds_csr_offsets():
+    cnf = read_dimacs(os.path.join(SYSTEM_DIR, 'cnf.dimacs'))
+    assert cnf.clause_count == 3
+    np.testing.assert_array_equal(cnf.indptr, [0, 1, 4, 7])
+    np.testing.assert_array_equal(cnf.indices, [1, -2, 3, 4, 2, -3, -4])
+    np.testing.assert_array_equal(cnf.clause(1), [-2, 3, 4])
+    np.testing.assert_array_equal(cnf.clause_sizes(), [1, 3, 3])
+
+
+def test_read_dimacs_names_variables_and_skips_comments():
+    cnf = read_dimacs(os.path.join(SYSTEM_DIR, 'cnf.dimacs'))
+    assert cnf.variable_count == 4
+    assert cnf.variable_names == ['Root', 'A', 'B', '4']
+
+
+def test_read_group_decodes_signs():
+    group = read_group(os.path.join(SYSTEM_DIR, 'group_core.csv'))
+    assert group.variable_names == ['Root', 'A', 'B', 'D']
+    np.testing.assert_array_equal(group.ids, [0, 1])
+    np.testing.assert_array_equal(group.groups, [0, 2])
+    np.testing.assert_array_equal(group.values, [[1, 0, 0, 0], [0, -1, 1, 0]])
+    np.testing.assert_array_equal(group.literals(1), [-2, 3])
+
+
+def test_read_sample_decodes_signs():
+    sample = read_sample(os.path.join(SYSTEM_DIR, 'sample_t2_mi0.csv'))
+    assert len(sample) == 2
+    assert sample.values.dtype == np.int8
+    np.testing.assert_array_equal(sample.ids, [0, 1])
+    np.testing.assert_array_equal(sample.groups, [0, 0])
+    np.testing.assert_array_equal(sample.values, [[1, 1, -1, 0], [1, -1, 1, 1]])
+    np.testing.assert_array_equal(sample.positive_bits(), [[0b11000000], [0b10110000]])
+    np.testing.assert_array_equal(sample.negative_bits(), [[0b00100000], [0b01000000]])
+
+
+@pytest.mark.parametrize('row', ['2;+;+;-', '2;+;+;-;+;+', '2;++-+'])
+def test_read_sample_rejects_malformed_rows(tmp_path, row):
+    path = tmp_path / 'sample_t1_mi0.csv'
+    path.write_text('Configuration;Root;A;B;D\n0;+;+;-;+\n' + row + '\n')
+    with pytest.raises(ValueError):
+        read_sample(path)
+
+
+def test_read_group_rejects_malformed_rows(tmp_path):
+    path = tmp_path / 'group_core.csv'
+    path.write_text('ID;Group;Root;A\n0;0;+\n')
+    with pytest.raises(ValueError):
+        read_group(path)
+
+
+def test_read_properties_unescapes_and_joins_lines():
+    properties = read_properties(PROPERTIES_FILE)
+    assert properties == {
+        't': '[1, 2, 3]',
+        'path': 'C:\\models\\',
+        'tab key': 'a\tb\nc',
+        'trailing': 'x ',
+        'name': 'Gr\u00fc\u00dfe',
+        'empty': '',
+        'bare': '',
+    }
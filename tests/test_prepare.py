@@ -0,0 +1,9 @@
+from evalresults.prepare import METRIC_ORDER, metric_categories
+
+
+def test_metric_categories_keep_equal_interaction_metrics():
+    categories = metric_categories(['default', 'EFI', 'CF-DF', 'CF-DF-EFI', 'ConF'])
+    assert categories[:2] == ['default', 'EFI']
+    assert categories.index('CF-DF-EFI') == categories.index('CF-DF') + 1
+    assert categories[-1] == 'ConF'
+    assert len(categories) == len(METRIC_ORDER) + 3
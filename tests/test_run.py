@@ -0,0 +1,55 @@
+import os
+
+import pandas as pd
+
+from evalresults.run import Run
+
+RUN_DIR = os.path.join(os.path.dirname(__file__), 'fixtures', 'run')
+PROPERTIES_FILE = os.path.join(RUN_DIR, 'data', 'data-2024-01-01_00-00-00', 'config.properties')
+
+
+def test_load_table_adds_incremental_to_old_complete_tables(tmp_path):
+    (tmp_path / 'plot').mkdir()
+    old = pd.DataFrame({'SystemID': [1, 2], 'ShuffleIteration': [0, 0], 'MetricID': [1, 1]})
+    old.to_pickle(tmp_path / 'plot' / 'complete.pkl', compression='gzip')
+
+    df = Run(str(tmp_path)).load_table('complete')
+    assert list(df.columns) == ['SystemID', 'ShuffleIteration', 'Incremental', 'MetricID']
+    assert df['Incremental'].dtype == bool
+    assert not df['Incremental'].any()
+    assert len(df.query('Incremental == False')) == 2
+
+
+def test_load_table_appends_incremental_to_other_old_complete_tables(tmp_path):
+    (tmp_path / 'plot').mkdir()
+    pd.DataFrame({'SystemID': [1]}).to_pickle(tmp_path / 'plot' / 'complete.pkl', compression='gzip')
+    assert list(Run(str(tmp_path)).load_table('complete').columns) == ['SystemID', 'Incremental']
+
+
+def test_run_walks_data_once():
+    run = Run(RUN_DIR)
+    assert run.name == 'run'
+    assert run.find_data_files('config.properties') == [PROPERTIES_FILE]
+    assert run.find_data_files('missing.csv') == []
+    assert run.data_dirs['data-2024-01-01_00-00-00']['t'] == '[1, 2, 3]'
+    assert run.data_dirs is run.data_dirs
+
+
+def test_run_caches_systems_and_their_files():
+    run = Run(RUN_DIR)
+    assert run.system_names() == ['sys']
+    system = run.system('sys')
+    assert run.system('sys') is system
+    assert system.cnf is system.cnf
+    assert system.core is system.core
+    assert system.core.values.shape == (2, 4)
+    assert system.atomic_literals is None
+    assert system.sample_keys() == [(1, 0), (2, 0)]
+    sample = system.sample(2, 0)
+    assert system.sample(2, 0) is sample
+    assert system.sample(1, 0) is not sample
+    assert len(sample) == 2
+
+
+def test_run_without_gen_has_no_systems(tmp_path):
+    assert Run(str(tmp_path)).system_names() == []